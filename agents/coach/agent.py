@@ -1,14 +1,15 @@
 from agents.coach.models.schemas import CoachInput, CoachAction
 from agents.coach.rules.rule_engine import apply_rules
 from agents.coach.decision.llm_decider import decide_with_llm
-from agents.coach.services.planner_repository import PlannerRepository
+from agents.coach.services.planner_repository import get_planner_repository
 
 
-def run_coach(input_data: CoachInput) -> CoachAction:
-    # Fetch scheduled tasks from MongoDB
-    repo = PlannerRepository()
-    scheduled_tasks = repo.get_scheduled_tasks()
-    input_data.scheduled_tasks = scheduled_tasks
+def run_coach(input_data: CoachInput, fetch_tasks: bool = True) -> CoachAction:
+    # Fetch scheduled tasks from MongoDB, unless the caller already did
+    if fetch_tasks:
+        repo = get_planner_repository()
+        scheduled_tasks = repo.get_scheduled_tasks()
+        input_data.scheduled_tasks = scheduled_tasks
 
     rule_action = apply_rules(input_data)
 
@@ -1,9 +1,21 @@
 import json
 import os
-import google.generativeai as genai
 from agents.coach.models.schemas import CoachInput, CoachAction
 from agents.coach.decision.prompt import SYSTEM_PROMPT, build_user_prompt
 
+# Gemini SDK and model are loaded on the first real API call; the mock
+# path (no API key) never imports the SDK at all.
+_gemini_model = None
+
+
+def get_gemini_model(api_key: str):
+    global _gemini_model
+    if _gemini_model is None:
+        import google.generativeai as genai
+        genai.configure(api_key=api_key)
+        _gemini_model = genai.GenerativeModel('gemini-1.5-flash')
+    return _gemini_model
+
 
 def call_gemini(system_prompt: str, user_prompt: str) -> str:
     api_key = os.getenv("GEMINI_API_KEY")
@@ -11,8 +23,7 @@ def call_gemini(system_prompt: str, user_prompt: str) -> str:
         # Return intelligent mock response based on input data for testing
         return get_mock_gemini_response(user_prompt)
     
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel('gemini-1.5-flash')
+    model = get_gemini_model(api_key)
     
     full_prompt = f"{system_prompt}\n\n{user_prompt}"
     try:
@@ -175,10 +186,9 @@ def decide_with_llm(input_data: CoachInput) -> CoachAction:
     raw = call_gemini(SYSTEM_PROMPT, user_prompt)
 
     try:
-        parsed = json.loads(raw)
-        action = CoachAction(**parsed)
-        return action
-    except (json.JSONDecodeError, ValueError) as e:
+        # Parse and validate in one pass; ValidationError is a ValueError
+        return CoachAction.model_validate_json(raw)
+    except ValueError as e:
         # Fallback to silence
         return CoachAction(
             action_type="silence",
@@ -1,25 +1,51 @@
 import os
-from pymongo import MongoClient
+from services.db import get_mongo_client
 from agents.coach.models.schemas import ScheduledTask
 
 
-MONGO_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
 DB_NAME = os.getenv("DB_NAME", "study_partner")
 TASK_SCHEDULING_COLLECTION = os.getenv("TASK_SCHEDULING_COLLECTION", "task_scheduling")
 STUDY_PLAN_COLLECTION = os.getenv("STUDY_PLAN_COLLECTION", "study_plans")
 
 
+_planner_repository = None
+
+
+def get_planner_repository():
+    """Return a process-wide PlannerRepository so its connection pool is reused."""
+    global _planner_repository
+    if _planner_repository is None:
+        _planner_repository = PlannerRepository()
+    return _planner_repository
+
+
 class PlannerRepository:
     def __init__(self):
-        self.client = MongoClient(MONGO_URI)
+        self.client = get_mongo_client()
         self.db = self.client[DB_NAME]
         self.task_collection = self.db[TASK_SCHEDULING_COLLECTION]
         self.study_plan_collection = self.db[STUDY_PLAN_COLLECTION]
 
     def get_scheduled_tasks(self) -> list[ScheduledTask]:
         try:
-            # Fetch the latest scheduling document
-            doc = self.task_collection.find_one(sort=[("_id", -1)])
+            # Fetch the latest scheduling document joined with its study
+            # plan's task details, in a single round trip
+            pipeline = [
+                {"$sort": {"_id": -1}},
+                {"$limit": 1},
+                {"$lookup": {
+                    "from": self.study_plan_collection.name,
+                    "localField": "study_plan_id",
+                    "foreignField": "_id",
+                    "as": "study_plan",
+                }},
+                {"$project": {
+                    "study_plan_id": 1,
+                    "sessions": 1,
+                    "study_plan.task_graph.atomic_tasks": 1,
+                }},
+            ]
+            doc = next(self.task_collection.aggregate(pipeline), None)
             if not doc:
                 # Fallback to mock data for testing
                 return self._get_mock_tasks()
@@ -28,10 +54,10 @@ class PlannerRepository:
             if not study_plan_id:
                 return self._get_mock_tasks()
             
-            # Fetch the study plan to get task details
-            study_plan = self.study_plan_collection.find_one({"_id": study_plan_id})
-            if not study_plan:
+            joined_plans = doc.get("study_plan")
+            if not joined_plans:
                 return self._get_mock_tasks()
+            study_plan = joined_plans[0]
             
             task_graph = study_plan.get("task_graph", {})
             atomic_tasks = task_graph.get("atomic_tasks", [])
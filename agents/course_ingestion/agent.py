@@ -1,31 +1,75 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
 from agents.course_ingestion.extraction.pdf_loader import extract_text_from_pdf
 from agents.course_ingestion.extraction.ocr import ocr_pdf
 from agents.course_ingestion.parsing.layout_parser import detect_sections
 from agents.course_ingestion.parsing.section_builder import build_subtopics
 from agents.course_ingestion.normalization.normalizer import normalize_course
-from agents.course_ingestion.services.database_service import DatabaseService
+from agents.course_ingestion.services.database_service import get_database_service
 from agents.course_ingestion.normalization.tokenizer import tokenize_subtopics
 from agents.course_ingestion.enrichment.llm_enricher import enrich_subtopic_with_llm
 
 
+# Each API worker process gets its own pool, so keep it small
+EXTRACTION_MAX_WORKERS = int(os.getenv("EXTRACTION_MAX_WORKERS", "4"))
+
+_extraction_pool = None
+_extraction_pool_lock = threading.Lock()
+
+
+def get_extraction_pool():
+    """
+    Return the process-wide pool used to extract several files at once.
+
+    Workers are spawned rather than forked: the API calls ingest_course from
+    a threadpool while pymongo monitor threads are running, and forking a
+    multithreaded process can deadlock the child.
+    """
+    global _extraction_pool
+    if _extraction_pool is None:
+        with _extraction_pool_lock:
+            if _extraction_pool is None:
+                _extraction_pool = ProcessPoolExecutor(
+                    max_workers=min(EXTRACTION_MAX_WORKERS, os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                # Stop the spawned workers when the process exits
+                atexit.register(_extraction_pool.shutdown)
+    return _extraction_pool
+
+
+def _extract_sections(pdf_path: str) -> list:
+    """Extract text from one course file and split it into sections."""
+    if pdf_path.lower().endswith(".txt"):
+        # Read text file directly
+        with open(pdf_path, "r", encoding="utf-8") as f:
+            text = f.read()
+    else:
+        # Step 1: extract text
+        text = extract_text_from_pdf(pdf_path)
+        # fallback to OCR if needed (text too small)
+        if len(text.strip()) < 50:
+            text = ocr_pdf(pdf_path)
+
+    # Step 2: detect sections
+    return detect_sections(text)
+
+
 def ingest_course(course_title: str, pdf_files: list):
     all_sections = []
 
-    for pdf_path in pdf_files:
-        if pdf_path.lower().endswith(".txt"):
-            # Read text file directly
-            with open(pdf_path, "r", encoding="utf-8") as f:
-                text = f.read()
-        else:
-            # Step 1: extract text
-            text = extract_text_from_pdf(pdf_path)
-            # fallback to OCR if needed (text too small)
-            if len(text.strip()) < 50:
-                text = ocr_pdf(pdf_path)
-
-        # Step 2: detect sections
-        sections = detect_sections(text)
-        all_sections.extend(sections)
+    # Steps 1-2 are CPU-bound and independent per file, so spread several
+    # files across processes. Results are merged in input order.
+    if len(pdf_files) > 1:
+        for sections in get_extraction_pool().map(_extract_sections, pdf_files):
+            all_sections.extend(sections)
+    else:
+        for pdf_path in pdf_files:
+            all_sections.extend(_extract_sections(pdf_path))
 
     # Step 3: build subtopics from sections
     subtopics = build_subtopics(all_sections)
@@ -49,7 +93,7 @@ def ingest_course(course_title: str, pdf_files: list):
     course_json = normalize_course(course_title, subtopics, pdf_files)
 
     # Step 7: save to MongoDB
-    db = DatabaseService()
-    course_id = db.save_course(course_json.dict())
+    db = get_database_service()
+    course_id = db.save_course(course_json.model_dump())
 
     return course_id
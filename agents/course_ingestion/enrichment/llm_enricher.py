@@ -14,6 +14,9 @@ load_dotenv()
 # Use LM Studio instead of Google Gemini
 LM_STUDIO_URL = "http://127.0.0.1:1234/v1/chat/completions"
 
+# One keep-alive connection to LM Studio for every subtopic of an ingestion
+_session = requests.Session()
+
 
 def call_llm(prompt: str, system_prompt: str = None) -> str:
     """Call LM Studio API for text generation."""
@@ -23,7 +26,7 @@ def call_llm(prompt: str, system_prompt: str = None) -> str:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
-        response = requests.post(
+        response = _session.post(
             LM_STUDIO_URL,
             json={
                 "messages": messages,
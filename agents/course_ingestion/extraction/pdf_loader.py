@@ -6,8 +6,5 @@ def extract_text_from_pdf(pdf_path: str) -> str:
     Extracts text from a digital PDF using PyMuPDF.
     Returns all text as a single string.
     """
-    doc = fitz.open(pdf_path)
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    return text
+    with fitz.open(pdf_path) as doc:
+        return "".join(page.get_text() for page in doc)
@@ -1,30 +1,40 @@
 import os
 import traceback
 from datetime import datetime
-from pymongo import MongoClient
+from services.db import get_mongo_client
 from bson import ObjectId
 
 # ----------------------------
 # MongoDB setup
 # ----------------------------
-MONGO_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
 DB_NAME = os.getenv("DB_NAME", "study_partner")
 # Use consistent collection names across all services
 COLLECTION_NAME = "courses"  # AI-processed courses
 STUDY_PLAN_COLLECTION = "studyplans"  # Match Mongoose pluralization
 TASK_SCHEDULING_COLLECTION = "task_scheduling"
 
-client = MongoClient(MONGO_URI)
+client = get_mongo_client()
 db = client[DB_NAME]
 collection = db[COLLECTION_NAME]
 study_plan_collection = db[STUDY_PLAN_COLLECTION]
 
 
+_database_service = None
+
+
+def get_database_service():
+    """Return a process-wide DatabaseService so its connection pool is reused."""
+    global _database_service
+    if _database_service is None:
+        _database_service = DatabaseService()
+    return _database_service
+
+
 class DatabaseService:
     """Database service for course and study plan operations."""
 
     def __init__(self):
-        self.client = MongoClient(MONGO_URI)
+        self.client = get_mongo_client()
         self.db = self.client[DB_NAME]
         self.collection = self.db[COLLECTION_NAME]
         self.study_plan_collection = self.db[STUDY_PLAN_COLLECTION]
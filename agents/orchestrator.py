@@ -7,7 +7,7 @@ This module coordinates the flow between:
 """
 
 from agents.course_ingestion.agent import ingest_course
-from agents.course_ingestion.services.database_service import DatabaseService
+from agents.course_ingestion.services.database_service import get_database_service
 from agents.planner.agent import PlannerAgent
 from agents.planner.models.task_graph import PlannerInput
 from agents.scheduler.agent import SchedulerAgent, SchedulingContext
@@ -48,7 +48,7 @@ def run_study_planner(
 
     # Step 2: Retrieve the normalized course JSON from MongoDB
     print("🔍 Retrieving course data from database...")
-    db = DatabaseService()
+    db = get_database_service()
     course_data = db.get_course_by_id(course_id)
 
     print("✅ Course data retrieved successfully")
@@ -126,7 +126,8 @@ def run_full_study_workflow(
         else:
             difficulty_str = "advanced"
 
-        task = Task(
+        # Fields come from the validated AtomicTask dump, so skip re-validation
+        task = Task.model_construct(
             task_id=atomic_task["id"],
             user_id="full_workflow_user",  # Fixed user ID for this workflow
             title=atomic_task["title"],
@@ -158,7 +159,7 @@ def run_full_study_workflow(
 
     # Step 7: Save the scheduled sessions to the task_scheduling collection
     print("💾 Saving scheduled sessions to database...")
-    db = DatabaseService()
+    db = get_database_service()
     scheduler_data = study_plan.model_dump()
     scheduler_data["course_id"] = planner_result.get("course_id")
     scheduling_id = db.save_scheduled_sessions(planner_result.get("study_plan_id"), scheduler_data)
@@ -218,7 +219,7 @@ def run_study_planner_with_course_id(
     """
     # Step 1: Retrieve the normalized course JSON from MongoDB
     print("🔍 Retrieving course data from database...")
-    db = DatabaseService()
+    db = get_database_service()
     course_data = db.get_course(course_id)
 
     if not course_data:
@@ -253,7 +254,7 @@ def run_study_planner_with_course_id(
     study_plan_data["course_id"] = course_id  # Link to the course
     study_plan_data["created_at"] = datetime.now().isoformat()
 
-    db = DatabaseService()
+    db = get_database_service()
     study_plan_id = db.save_study_plan(study_plan_data)
     print(f"✅ Study plan saved with ID: {study_plan_id}")
 
@@ -269,7 +269,6 @@ class PlannerAgent:
             List of AtomicTask objects covering the course
         """
         from agents.planner.models.task_graph import AtomicTask
-        import uuid
 
         tasks = []
         task_id_counter = 1
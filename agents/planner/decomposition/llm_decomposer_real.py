@@ -3,6 +3,18 @@ from typing import List
 import uuid
 from agents.planner.models.task_graph import AtomicTask
 
+DECOMPOSER_INSTRUCTIONS = """You are a study planner assistant.
+
+Break the user's goal into atomic study tasks. Each task should be <= 45 minutes, include review sessions, and respect prerequisites. Total time must fit within the minutes the user gives.
+
+Return ONLY a valid JSON array with this exact format:
+[{"title": "task name", "description": "task description", "estimated_minutes": 30, "difficulty": 0.5, "prerequisites": ["prerequisite task title"]}]
+
+IMPORTANT: Prerequisites must be an array of STRINGS (task titles), not objects!
+
+Example:
+[{"title": "Learn Vector Operations", "description": "Study basic vector addition, scalar multiplication", "estimated_minutes": 30, "difficulty": 0.4, "prerequisites": []}, {"title": "Apply Vector Operations", "description": "Practice vector operations with examples", "estimated_minutes": 30, "difficulty": 0.5, "prerequisites": ["Learn Vector Operations"]}]"""
+
 
 class LLMDecomposerReal:
     """
@@ -25,24 +37,15 @@ class LLMDecomposerReal:
         :param concepts: retrieved concepts from RAG
         :return: list of AtomicTask
         """
-        # Build prompt
+        # Build prompt: static instructions stay in the system message so the
+        # server can reuse their cached prefix; per-request data goes last.
         context = "\n".join(f"- {c}" for c in concepts)
-        prompt = f"""You are a study planner assistant.
-
-Goal: {goal}
-
-Relevant concepts:
+        prompt = f"""Relevant concepts:
 {context}
 
-Break this goal into atomic study tasks. Each task should be <= 45 minutes, include review sessions, and respect prerequisites. Total time should fit within {available_minutes} minutes.
-
-Return ONLY a valid JSON array with this exact format:
-[{{"title": "task name", "description": "task description", "estimated_minutes": 30, "difficulty": 0.5, "prerequisites": ["prerequisite task title"]}}]
-
-IMPORTANT: Prerequisites must be an array of STRINGS (task titles), not objects!
+Goal: {goal}
 
-Example:
-[{{"title": "Learn Vector Operations", "description": "Study basic vector addition, scalar multiplication", "estimated_minutes": 30, "difficulty": 0.4, "prerequisites": []}}, {{"title": "Apply Vector Operations", "description": "Practice vector operations with examples", "estimated_minutes": 30, "difficulty": 0.5, "prerequisites": ["Learn Vector Operations"]}}]"""
+Total time should fit within {available_minutes} minutes."""
 
         # Call LM Studio API
         try:
@@ -50,7 +53,10 @@ Example:
                 self.endpoint,
                 json={
                     "model": "qwen/qwen2.5-vl-7b",
-                    "messages": [{"role": "user", "content": prompt}],
+                    "messages": [
+                        {"role": "system", "content": DECOMPOSER_INSTRUCTIONS},
+                        {"role": "user", "content": prompt},
+                    ],
                     "max_tokens": 1500,
                     "temperature": 0.7,
                 },
@@ -4,6 +4,14 @@ import uuid
 from typing import List
 from agents.planner.models.task_graph import AtomicTask
 
+# Generic chain used when no concepts are available:
+# (title, description, estimated_minutes, difficulty), each step requiring the last
+FALLBACK_TASKS = (
+    ("Introduction to {goal}", "Basic concepts and overview of {goal}", 30, 0.3),
+    ("Core Concepts of {goal}", "Essential principles and foundations of {goal}", 45, 0.5),
+    ("Advanced Topics in {goal}", "Complex aspects and applications of {goal}", 45, 0.7),
+)
+
 
 class SimpleGoalDecomposer:
     """
@@ -59,35 +67,17 @@ class SimpleGoalDecomposer:
 
         # Add a general study task if no concepts
         if not tasks:
-            task1_id = str(uuid.uuid4())
-            task2_id = str(uuid.uuid4())
-            task3_id = str(uuid.uuid4())
-
+            task_ids = [str(uuid.uuid4()) for _ in FALLBACK_TASKS]
             tasks = [
                 AtomicTask(
-                    id=task1_id,
-                    title=f"Introduction to {goal}",
-                    description=f"Basic concepts and overview of {goal}",
-                    estimated_minutes=30,
-                    difficulty=0.3,
-                    prerequisites=[],
-                ),
-                AtomicTask(
-                    id=task2_id,
-                    title=f"Core Concepts of {goal}",
-                    description=f"Essential principles and foundations of {goal}",
-                    estimated_minutes=45,
-                    difficulty=0.5,
-                    prerequisites=[task1_id],
-                ),
-                AtomicTask(
-                    id=task3_id,
-                    title=f"Advanced Topics in {goal}",
-                    description=f"Complex aspects and applications of {goal}",
-                    estimated_minutes=45,
-                    difficulty=0.7,
-                    prerequisites=[task2_id],
-                ),
+                    id=task_ids[i],
+                    title=title.format(goal=goal),
+                    description=description.format(goal=goal),
+                    estimated_minutes=minutes,
+                    difficulty=difficulty,
+                    prerequisites=[task_ids[i - 1]] if i > 0 else [],
+                )
+                for i, (title, description, minutes, difficulty) in enumerate(FALLBACK_TASKS)
             ]
 
         return tasks
@@ -1,5 +1,14 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
+# (model_name, sha256 of text) -> embedding, shared by all EmbeddingModel
+# instances so re-ingesting the same course does not re-encode its chunks.
+_EMBEDDING_CACHE: "OrderedDict[tuple[str, str], np.ndarray]" = OrderedDict()
+_EMBEDDING_CACHE_SIZE = 10_000
+
 
 class EmbeddingModel:
     """
@@ -7,10 +16,39 @@ class EmbeddingModel:
     """
 
     def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        self.model_name = model_name
         self.model = SentenceTransformer(model_name)
 
     def encode(self, texts: list[str]) -> list[list[float]]:
         """
-        Convert a list of texts into embeddings
+        Convert a list of texts into embeddings.
+
+        Previously seen texts are served from an LRU cache; the rest are
+        encoded together in a single batch.
         """
-        return self.model.encode(texts, convert_to_numpy=True)
+        if not texts:
+            return self.model.encode(texts, convert_to_numpy=True)
+
+        keys = [
+            (self.model_name, hashlib.sha256(text.encode("utf-8")).hexdigest())
+            for text in texts
+        ]
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key in _EMBEDDING_CACHE:
+                _EMBEDDING_CACHE.move_to_end(key)
+            elif key not in missing:
+                missing[key] = text
+
+        if missing:
+            encoded = self.model.encode(list(missing.values()), convert_to_numpy=True)
+            for key, embedding in zip(missing, encoded):
+                _EMBEDDING_CACHE[key] = embedding
+
+        embeddings = np.stack([_EMBEDDING_CACHE[key] for key in keys])
+
+        while len(_EMBEDDING_CACHE) > _EMBEDDING_CACHE_SIZE:
+            _EMBEDDING_CACHE.popitem(last=False)
+
+        return embeddings
@@ -1,22 +1,36 @@
 """Prompt builder for RAG-enhanced task decomposition."""
 
 import os
-from pymongo import MongoClient
+from pymongo import DESCENDING
+from services.db import get_mongo_client
 from datetime import datetime
 from typing import Optional
 
+# Set once the study plan indexes exist, so later instances skip the round trip
+_indexes_ready = False
+
 
 class SchedulingService:
     """Service for saving and retrieving study plans from MongoDB."""
     
     def __init__(self):
-        mongo_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
         db_name = os.getenv("MONGO_DB_NAME", "study_partner")
         
-        self.client = MongoClient(mongo_uri)
+        self.client = get_mongo_client()
         self.db = self.client[db_name]
         self.study_plan_collection = self.db["study_plans"]
         self.task_scheduling_collection = self.db["task_scheduling"]
+
+        self._ensure_indexes()
+
+    def _ensure_indexes(self) -> None:
+        """Create the paginated plan listing index once per process."""
+        global _indexes_ready
+        if _indexes_ready:
+            return
+        # Create index on user_id and created_at for paginated plan listing
+        self.study_plan_collection.create_index([("user_id", 1), ("created_at", DESCENDING)])
+        _indexes_ready = True
     
     def save_study_plan(self, user_id: str, study_plan: dict) -> str:
         """Save a study plan and create task scheduling."""
@@ -57,11 +71,12 @@ class SchedulingService:
         
         return study_plan_id
     
-    def get_user_plans(self, user_id: str, limit: int = 10):
-        """Get study plans for a user."""
+    def get_user_plans(self, user_id: str, limit: int = 10, offset: int = 0):
+        """Get one page of study plans for a user, newest first."""
         plans = self.study_plan_collection.find(
             {"user_id": user_id},
-            sort=[("created_at", -1)],
+            sort=[("created_at", DESCENDING)],
+            skip=offset,
             limit=limit
         )
         return list(plans)
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from typing import List, Set
+import heapq
 import logging
 
 from agents.scheduler.models.schedule_schema import (
@@ -7,6 +8,7 @@ from agents.scheduler.models.schedule_schema import (
     ScheduledSession,
 )
 from agents.scheduler.services.calendar_normalizer import normalize_busy_slots
+from agents.scheduler.services.interval_index import IntervalIndex
 from agents.scheduler.services.slot_generator import generate_free_slots
 from agents.scheduler.services.scheduling_heuristics import score_slot
 from models.task import Task
@@ -16,6 +18,14 @@ logger = logging.getLogger(__name__)
 
 class SchedulingContext:
 
+    __slots__ = (
+        "calendar_events",
+        "historical_productivity",
+        "fatigue_predictions",
+        "max_minutes_per_day",
+        "allow_late_night",
+    )
+
     def __init__(
         self,
         calendar_events: list,
@@ -68,6 +78,12 @@ class SchedulerAgent:
         # Build title→id mapping for prerequisite resolution
         title_to_id = {task.title: task.id for task in tasks}
         
+        # Visit tasks in dependency order so prerequisites are met on first try
+        tasks = self._order_tasks(tasks, title_to_id)
+        
+        # Index calendar events once; each day queries its own window
+        busy_index = IntervalIndex(normalize_busy_slots(context.calendar_events))
+        
         # Start from tomorrow 8:00 AM
         current_date = datetime.now().replace(
             hour=self.WORK_START_HOUR,
@@ -90,6 +106,7 @@ class SchedulerAgent:
                 task_index=task_index,
                 current_date=current_date,
                 context=context,
+                busy_index=busy_index,
                 scheduled_task_ids=scheduled_task_ids,
                 skipped_tasks=skipped_tasks,
                 title_to_id=title_to_id,
@@ -141,6 +158,7 @@ class SchedulerAgent:
         task_index: int,
         current_date: datetime,
         context: SchedulingContext,
+        busy_index: IntervalIndex,
         scheduled_task_ids: Set[str],
         skipped_tasks: Set[str],
         title_to_id: dict,
@@ -159,12 +177,8 @@ class SchedulerAgent:
         )
         day_end = day_start.replace(hour=self.WORK_END_HOUR)
         
-        # Normalize busy slots for this day
-        day_events = [
-            ev for ev in context.calendar_events
-            if datetime.fromisoformat(ev["start"]).date() == day_start.date()
-        ]
-        busy_slots = normalize_busy_slots(day_events)
+        # Busy slots intersecting this day's work window
+        busy_slots = busy_index.overlap(day_start, day_end)
         
         # Generate free slots for this day
         free_slots = generate_free_slots(
@@ -258,6 +272,60 @@ class SchedulerAgent:
         
         return sessions, daily_minutes, fallback_used
     
+    def _order_tasks(self, tasks: List[Task], title_to_id: dict) -> List[Task]:
+        """
+        Order tasks topologically by prerequisites (Kahn's algorithm).
+        
+        Among ready tasks the one earliest in the input list goes first, so
+        the planner's ordering (and topic locality) is kept wherever the
+        dependencies allow it. Tasks stuck on cycles or on prerequisites that
+        are not part of the plan are appended in their original order and
+        left for _prerequisites_met to skip.
+        
+        Args:
+            tasks: Tasks in planner order
+            title_to_id: Title→id mapping for prerequisite resolution
+            
+        Returns:
+            Tasks in a prerequisite-respecting order
+        """
+        # Common case: no dependencies at all, planner order already works
+        if not any(task.prerequisites for task in tasks):
+            return tasks
+        
+        positions_by_id: dict = {}
+        for position, task in enumerate(tasks):
+            positions_by_id.setdefault(task.id, []).append(position)
+        
+        indegree = [0] * len(tasks)
+        dependents: dict = {}
+        for position, task in enumerate(tasks):
+            for prereq in task.prerequisites:
+                prereq_id = title_to_id.get(prereq, prereq)
+                if prereq_id not in positions_by_id:
+                    continue
+                indegree[position] += len(positions_by_id[prereq_id])
+                dependents.setdefault(prereq_id, []).append(position)
+        
+        ready = [position for position, degree in enumerate(indegree) if degree == 0]
+        heapq.heapify(ready)
+        visited = [False] * len(tasks)
+        ordered: List[Task] = []
+        
+        while ready:
+            position = heapq.heappop(ready)
+            visited[position] = True
+            task = tasks[position]
+            ordered.append(task)
+            
+            for dependent in dependents.get(task.id, ()):
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    heapq.heappush(ready, dependent)
+        
+        ordered.extend(task for position, task in enumerate(tasks) if not visited[position])
+        return ordered
+    
     def _prerequisites_met(
         self,
         task: Task,
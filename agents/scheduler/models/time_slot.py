@@ -1,8 +1,9 @@
+from dataclasses import dataclass
 from datetime import datetime
-from pydantic import BaseModel
 
 
-class TimeSlot(BaseModel):
+@dataclass(slots=True)
+class TimeSlot:
     start: datetime
     end: datetime
-    score: float = 0.0
\ No newline at end of file
+    score: float = 0.0
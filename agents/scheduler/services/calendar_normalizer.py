@@ -12,7 +12,8 @@ def normalize_busy_slots(raw_events: List[dict]) -> List[TimeSlot]:
     Normalize raw calendar events into TimeSlot objects.
     
     Args:
-        raw_events: List of calendar events with ISO format timestamps.
+        raw_events: List of calendar events with ISO format timestamps or
+                   already-parsed datetime objects (e.g. BSON dates).
                    Example: [{"start": "2026-02-06T09:00:00", "end": "2026-02-06T10:30:00"}]
     
     Returns:
@@ -22,8 +23,18 @@ def normalize_busy_slots(raw_events: List[dict]) -> List[TimeSlot]:
 
     for ev in raw_events:
         try:
-            start = datetime.fromisoformat(ev["start"])
-            end = datetime.fromisoformat(ev["end"])
+            raw_start = ev["start"]
+            raw_end = ev["end"]
+            start = (
+                raw_start
+                if isinstance(raw_start, datetime)
+                else datetime.fromisoformat(raw_start)
+            )
+            end = (
+                raw_end
+                if isinstance(raw_end, datetime)
+                else datetime.fromisoformat(raw_end)
+            )
             
             if start >= end:
                 logger.warning(f"Invalid event: start {start} >= end {end}")
@@ -0,0 +1,44 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import List
+
+from agents.scheduler.models.time_slot import TimeSlot
+
+
+class IntervalIndex:
+    """
+    Static index over busy time slots for repeated overlap queries.
+
+    Built once per scheduling call so that each day only looks at the
+    events that intersect its work window instead of rescanning the whole
+    calendar.
+    """
+
+    def __init__(self, slots: List[TimeSlot]):
+        self._slots = sorted(slots, key=lambda s: s.start)
+        self._starts = [s.start for s in self._slots]
+        self._max_duration = max(
+            (s.end - s.start for s in self._slots),
+            default=timedelta(0),
+        )
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def overlap(self, window_start: datetime, window_end: datetime) -> List[TimeSlot]:
+        """
+        Return the slots that intersect [window_start, window_end).
+
+        Only slots starting within one "longest slot" before the window can
+        reach into it, so the candidate range is found with two bisections.
+
+        Args:
+            window_start: Start of the query window
+            window_end: End of the query window
+
+        Returns:
+            Overlapping TimeSlot objects, sorted by start time
+        """
+        lo = bisect_left(self._starts, window_start - self._max_duration)
+        hi = bisect_left(self._starts, window_end)
+        return [s for s in self._slots[lo:hi] if s.end > window_start]
@@ -6,11 +6,26 @@ Handles dynamic schedule modifications requested by the Coach agent.
 import os
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
-from pymongo import MongoClient
+from services.db import get_mongo_client
 
 from agents.coach.models.schemas import ScheduleChange
 
 
+def _as_datetime(value: Any) -> datetime:
+    """Accept both BSON dates (datetime) and legacy ISO strings."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _build_task_index(sessions: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Map each task_id to the index of its first session."""
+    task_index: Dict[str, int] = {}
+    for idx, session in enumerate(sessions):
+        task_index.setdefault(session["task_id"], idx)
+    return task_index
+
+
 class ScheduleUpdater:
     """
     Service for applying schedule changes requested by the Coach agent.
@@ -18,11 +33,10 @@ class ScheduleUpdater:
     """
 
     def __init__(self):
-        self.mongo_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
         self.db_name = os.getenv("DB_NAME", "study_partner")
         self.collection_name = os.getenv("TASK_SCHEDULING_COLLECTION", "task_scheduling")
 
-        self.client = MongoClient(self.mongo_uri)
+        self.client = get_mongo_client()
         self.db = self.client[self.db_name]
         self.collection = self.db[self.collection_name]
 
@@ -43,6 +57,11 @@ class ScheduleUpdater:
                 print("No scheduling document found")
                 return False
 
+            # DatabaseService.save_scheduled_sessions always writes a
+            # "sessions" list; backfill it once for older documents so the
+            # handlers below can mutate doc["sessions"] in place.
+            doc.setdefault("sessions", [])
+
             if schedule_change.action == "add_break":
                 return self._add_break(doc, schedule_change)
             elif schedule_change.action == "extend_task":
@@ -66,87 +85,79 @@ class ScheduleUpdater:
         if not change.duration_minutes:
             return False
 
-        sessions = doc.get("sessions", [])
         current_time = datetime.now()
+        shift = timedelta(minutes=change.duration_minutes)
 
-        # Create a break session
+        # Create a break session. Datetimes are stored as BSON dates, the
+        # same as SchedulerAgent output persisted by DatabaseService.
         break_session = {
             "task_id": f"break_{int(current_time.timestamp())}",
-            "start_datetime": current_time.isoformat(),
-            "end_datetime": (current_time + timedelta(minutes=change.duration_minutes)).isoformat(),
+            "start_datetime": current_time,
+            "end_datetime": current_time + shift,
             "break_after_minutes": 0,
             "slot_score": 1.0,
             "scheduled": True
         }
 
-        # Insert break at the beginning (immediate break)
-        sessions.insert(0, break_session)
-
-        # Shift all subsequent sessions by the break duration
-        for i in range(1, len(sessions)):
-            session = sessions[i]
-            # Handle both string and datetime formats
-            if isinstance(session["start_datetime"], str):
-                start_time = datetime.fromisoformat(session["start_datetime"])
-                end_time = datetime.fromisoformat(session["end_datetime"])
-            else:
-                start_time = session["start_datetime"]
-                end_time = session["end_datetime"]
+        # Insert break at the beginning (immediate break) and shift all
+        # subsequent sessions by the break duration
+        new_sessions = [break_session]
+        for session in doc["sessions"]:
+            session["start_datetime"] = _as_datetime(session["start_datetime"]) + shift
+            session["end_datetime"] = _as_datetime(session["end_datetime"]) + shift
+            new_sessions.append(session)
 
-            # Shift this session
-            session["start_datetime"] = (start_time + timedelta(minutes=change.duration_minutes)).isoformat()
-            session["end_datetime"] = (end_time + timedelta(minutes=change.duration_minutes)).isoformat()
+        doc["sessions"] = new_sessions
 
         # Save the updated document
         self.collection.replace_one({"_id": doc["_id"]}, doc)
         print(f"Added {change.duration_minutes}-minute break and shifted subsequent tasks")
         return True
 
-        return False
-
     def _reschedule_task(self, doc: Dict[str, Any], change: ScheduleChange) -> bool:
         """Reschedule a task to a new time."""
         if not change.new_start_time or not change.affected_task_ids:
             return False
 
-        sessions = doc.get("sessions", [])
+        sessions = doc["sessions"]
         task_id = change.affected_task_ids[0]
 
-        for session in sessions:
-            if session["task_id"] == task_id:
-                # Calculate duration
-                start_time = datetime.fromisoformat(session["start_datetime"])
-                end_time = datetime.fromisoformat(session["end_datetime"])
-                duration = end_time - start_time
+        idx = _build_task_index(sessions).get(task_id)
+        if idx is None:
+            return False
+
+        session = sessions[idx]
 
-                # Set new times
-                session["start_datetime"] = change.new_start_time.isoformat()
-                session["end_datetime"] = (change.new_start_time + duration).isoformat()
+        # Calculate duration
+        start_time = _as_datetime(session["start_datetime"])
+        end_time = _as_datetime(session["end_datetime"])
+        duration = end_time - start_time
 
-                self.collection.replace_one({"_id": doc["_id"]}, doc)
-                print(f"Rescheduled task {task_id} to {change.new_start_time}")
-                return True
+        # Set new times
+        session["start_datetime"] = change.new_start_time
+        session["end_datetime"] = change.new_start_time + duration
 
-        return False
+        self.collection.replace_one({"_id": doc["_id"]}, doc)
+        print(f"Rescheduled task {task_id} to {change.new_start_time}")
+        return True
 
     def _cancel_task(self, doc: Dict[str, Any], change: ScheduleChange) -> bool:
         """Cancel/remove a task from the schedule."""
         if not change.affected_task_ids:
             return False
 
-        sessions = doc.get("sessions", [])
+        sessions = doc["sessions"]
         task_id = change.affected_task_ids[0]
 
-        # Remove the task
-        original_length = len(sessions)
-        sessions[:] = [s for s in sessions if s["task_id"] != task_id]
-
-        if len(sessions) < original_length:
-            self.collection.replace_one({"_id": doc["_id"]}, doc)
-            print(f"Cancelled task {task_id}")
-            return True
+        # Remove the task in one pass; nothing removed means it was absent
+        remaining = [s for s in sessions if s["task_id"] != task_id]
+        if len(remaining) == len(sessions):
+            return False
+        sessions[:] = remaining
 
-        return False
+        self.collection.replace_one({"_id": doc["_id"]}, doc)
+        print(f"Cancelled task {task_id}")
+        return True
 
     def _suspend_session(self, doc: Dict[str, Any], change: ScheduleChange) -> bool:
         """Suspend the current study session until tomorrow."""
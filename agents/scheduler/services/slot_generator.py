@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List
 import logging
 
@@ -25,23 +25,25 @@ def generate_free_slots(
     Returns:
         List of free TimeSlot objects, sorted by start time
     """
-    busy_slots = sorted(busy_slots, key=lambda s: s.start)
+    min_gap = timedelta(minutes=min_slot_minutes)
+
+    # Sweep over plain (start, end) pairs so the loop body does no attribute
+    # lookups or float conversions. Input from IntervalIndex.overlap is
+    # already in start order, which Timsort handles in a single linear pass.
+    intervals = sorted((b.start, b.end) for b in busy_slots)
 
     free = []
     cursor = day_start
 
-    for b in busy_slots:
-        if b.start > cursor:
-            delta = (b.start - cursor).total_seconds() / 60
-            if delta >= min_slot_minutes:
-                free.append(TimeSlot(start=cursor, end=b.start))
+    for start, end in intervals:
+        if start > cursor and start - cursor >= min_gap:
+            free.append(TimeSlot(start=cursor, end=start))
 
-        cursor = max(cursor, b.end)
+        if end > cursor:
+            cursor = end
 
-    if cursor < day_end:
-        delta = (day_end - cursor).total_seconds() / 60
-        if delta >= min_slot_minutes:
-            free.append(TimeSlot(start=cursor, end=day_end))
+    if cursor < day_end and day_end - cursor >= min_gap:
+        free.append(TimeSlot(start=cursor, end=day_end))
 
     logger.debug(
         f"Generated {len(free)} free slots for {day_start.date()} "
@@ -0,0 +1,16 @@
+import pytest
+
+from agents.course_ingestion.services.database_service import DatabaseService
+from agents.scheduler.agent import SchedulerAgent
+
+
+@pytest.fixture(scope="module")
+def scheduler_agent():
+    """Shared SchedulerAgent; build_schedule keeps no state between calls."""
+    return SchedulerAgent()
+
+
+@pytest.fixture(scope="module")
+def db_service():
+    """Shared DatabaseService; its Mongo client is process-wide, so it is not closed here."""
+    return DatabaseService()
@@ -8,10 +8,9 @@ through task generation and scheduling.
 import pytest
 from datetime import datetime, timedelta
 
-from agents.course_ingestion.services.database_service import DatabaseService
 from agents.planner.agent import PlannerAgent
 from agents.planner.models.task_graph import PlannerInput
-from agents.scheduler.agent import SchedulerAgent, SchedulingContext
+from agents.scheduler.agent import SchedulingContext
 from models.task import Task
 
 
@@ -23,14 +22,13 @@ TEST_COURSE_ID = "6984fed077f336f5b99c9c45"
 class TestPlannerToSchedulerIntegration:
     """Integration tests for the complete planner-to-scheduler pipeline."""
 
-    def test_full_pipeline_from_mongodb_course(self):
+    def test_full_pipeline_from_mongodb_course(self, scheduler_agent, db_service):
         """Test the complete pipeline from MongoDB course to scheduled study plan."""
         # Skip if no test course ID is configured
         if TEST_COURSE_ID == "<replace-with-existing-course-id>":
             pytest.skip("TEST_COURSE_ID not configured with actual course ID")
 
         # Step 1: Fetch course from MongoDB
-        db_service = DatabaseService()
         course_doc = db_service.get_course_by_id(TEST_COURSE_ID)
 
         assert course_doc is not None, f"Course with ID {TEST_COURSE_ID} not found in database"
@@ -79,15 +77,13 @@ class TestPlannerToSchedulerIntegration:
             tasks.append(task)
 
         # Step 4: Schedule tasks using SchedulerAgent
-        scheduler = SchedulerAgent()
-
         # Create minimal scheduling context
         context = SchedulingContext(
             calendar_events=[],  # No calendar conflicts for this test
             max_minutes_per_day=240,  # 4 hours per day
         )
 
-        study_plan = scheduler.build_schedule(tasks, context)
+        study_plan = scheduler_agent.build_schedule(tasks, context)
 
         # Step 5: Verify the final study plan
         assert study_plan is not None
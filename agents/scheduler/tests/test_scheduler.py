@@ -1,11 +1,15 @@
-from agents.scheduler.agent import SchedulerAgent, SchedulingContext
+from datetime import datetime
+
+from agents.scheduler.agent import SchedulingContext
+from agents.scheduler.services.calendar_normalizer import normalize_busy_slots
+from agents.scheduler.services.interval_index import IntervalIndex
 from models.task import Task
 
 
 class TestSchedulerBasic:
     """Basic scheduling functionality tests."""
 
-    def test_scheduler_basic_plan(self):
+    def test_scheduler_basic_plan(self, scheduler_agent):
         """Test basic scheduling with no calendar conflicts."""
         tasks = [
             Task(
@@ -35,8 +39,7 @@ class TestSchedulerBasic:
             ]
         )
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         assert plan.total_minutes > 0
         assert len(plan.sessions) > 0
@@ -46,7 +49,7 @@ class TestSchedulerBasic:
 class TestPrerequisiteAwareScheduling:
     """Tests for prerequisite-aware scheduling."""
 
-    def test_prerequisites_enforced(self):
+    def test_prerequisites_enforced(self, scheduler_agent):
         """Test that tasks without met prerequisites are skipped."""
         tasks = [
             Task(
@@ -77,8 +80,7 @@ class TestPrerequisiteAwareScheduling:
 
         context = SchedulingContext(calendar_events=[])
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         # t1 should be scheduled
         task_ids = [s.task_id for s in plan.sessions]
@@ -88,7 +90,7 @@ class TestPrerequisiteAwareScheduling:
         assert "t2" in task_ids
         assert "t3" in task_ids
 
-    def test_missing_prerequisite_skipped(self):
+    def test_missing_prerequisite_skipped(self, scheduler_agent):
         """Test that tasks with missing prerequisites are skipped and logged."""
         tasks = [
             Task(
@@ -103,14 +105,13 @@ class TestPrerequisiteAwareScheduling:
 
         context = SchedulingContext(calendar_events=[])
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         # t2 should be skipped because prerequisite is missing
         assert "t2" in plan.skipped_tasks
         assert len(plan.sessions) == 0
 
-    def test_prerequisite_ordering(self):
+    def test_prerequisite_ordering(self, scheduler_agent):
         """Test that tasks are scheduled in prerequisite order."""
         tasks = [
             Task(
@@ -141,8 +142,7 @@ class TestPrerequisiteAwareScheduling:
 
         context = SchedulingContext(calendar_events=[])
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         # All should be scheduled
         task_ids = [s.task_id for s in plan.sessions]
@@ -161,7 +161,7 @@ class TestPrerequisiteAwareScheduling:
 class TestMultiDayScheduling:
     """Tests for multi-day scheduling."""
 
-    def test_multiday_scheduling(self):
+    def test_multiday_scheduling(self, scheduler_agent):
         """Test that tasks spill to next day when current day is full."""
         tasks = [
             Task(
@@ -180,14 +180,13 @@ class TestMultiDayScheduling:
             max_minutes_per_day=240,  # 4 hours per day
         )
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         # Should span multiple days
         dates = set(s.start_datetime.date() for s in plan.sessions)
         assert len(dates) >= 2 or plan.fallback_used
 
-    def test_respects_work_window(self):
+    def test_respects_work_window(self, scheduler_agent):
         """Test that scheduling respects the work window (8:00 - 22:00)."""
         tasks = [
             Task(
@@ -202,14 +201,13 @@ class TestMultiDayScheduling:
 
         context = SchedulingContext(calendar_events=[])
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         for session in plan.sessions:
             assert session.start_datetime.hour >= 8
             assert session.end_datetime.hour <= 22
 
-    def test_respects_max_minutes_per_day(self):
+    def test_respects_max_minutes_per_day(self, scheduler_agent):
         """Test that daily scheduling respects max_minutes_per_day limit."""
         tasks = [
             Task(
@@ -228,8 +226,7 @@ class TestMultiDayScheduling:
             max_minutes_per_day=200,
         )
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         # Group sessions by day
         from collections import defaultdict
@@ -251,7 +248,7 @@ class TestMultiDayScheduling:
 class TestFallbackScheduling:
     """Tests for fallback Pomodoro-style scheduling."""
 
-    def test_fallback_strategy_used(self):
+    def test_fallback_strategy_used(self, scheduler_agent):
         """Test that fallback strategy is used when no free slots exist."""
         # Create heavy calendar that blocks all time
         calendar_events = [
@@ -278,15 +275,14 @@ class TestFallbackScheduling:
             max_minutes_per_day=100,
         )
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         # Fallback might be used or task skipped
         # At minimum, we should have a valid result
         assert isinstance(plan.total_minutes, int)
         assert isinstance(plan.fallback_used, bool)
 
-    def test_fallback_pomodoro_format(self):
+    def test_fallback_pomodoro_format(self, scheduler_agent):
         """Test that fallback scheduling uses 25-5 Pomodoro format."""
         # Barely any free time - should trigger fallback on second day
         calendar_events = [
@@ -320,8 +316,7 @@ class TestFallbackScheduling:
             max_minutes_per_day=100,
         )
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         # Should have scheduled something
         assert plan.total_minutes >= 0
@@ -331,19 +326,18 @@ class TestFallbackScheduling:
 class TestSchedulerEdgeCases:
     """Tests for edge cases and error handling."""
 
-    def test_empty_task_list(self):
+    def test_empty_task_list(self, scheduler_agent):
         """Test scheduling with no tasks."""
         tasks = []
         context = SchedulingContext(calendar_events=[])
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         assert plan.total_minutes == 0
         assert len(plan.sessions) == 0
         assert plan.skipped_tasks == []
 
-    def test_all_tasks_skipped(self):
+    def test_all_tasks_skipped(self, scheduler_agent):
         """Test when all tasks are skipped due to unmet prerequisites."""
         tasks = [
             Task(
@@ -366,14 +360,13 @@ class TestSchedulerEdgeCases:
 
         context = SchedulingContext(calendar_events=[])
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         assert len(plan.sessions) == 0
         assert "t1" in plan.skipped_tasks
         assert "t2" in plan.skipped_tasks
 
-    def test_circular_prerequisites_ignored(self):
+    def test_circular_prerequisites_ignored(self, scheduler_agent):
         """Test that circular prerequisites don't cause infinite loops."""
         tasks = [
             Task(
@@ -396,14 +389,13 @@ class TestSchedulerEdgeCases:
 
         context = SchedulingContext(calendar_events=[])
 
-        agent = SchedulerAgent()
         # Should complete without hanging
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         # Both should be skipped due to circular dependency
         assert "t1" in plan.skipped_tasks or "t2" in plan.skipped_tasks
 
-    def test_high_max_minutes_per_day(self):
+    def test_high_max_minutes_per_day(self, scheduler_agent):
         """Test scheduling with very high daily limit."""
         tasks = [
             Task(
@@ -422,10 +414,38 @@ class TestSchedulerEdgeCases:
             max_minutes_per_day=999,  # Very high
         )
 
-        agent = SchedulerAgent()
-        plan = agent.build_schedule(tasks, context)
+        plan = scheduler_agent.build_schedule(tasks, context)
 
         # Most or all tasks should fit in one day
         assert plan.span_days == 1
         assert len(plan.sessions) >= 5
 
+
+class TestIntervalIndex:
+    """Busy-slot interval index tests."""
+
+    def test_overlap_returns_only_intersecting_slots(self):
+        """Test that a day window only sees events touching it."""
+        slots = normalize_busy_slots([
+            {"start": "2026-02-05T23:00:00", "end": "2026-02-06T09:00:00"},
+            {"start": "2026-02-06T10:00:00", "end": "2026-02-06T11:00:00"},
+            {"start": "2026-02-07T10:00:00", "end": "2026-02-07T11:00:00"},
+        ])
+        index = IntervalIndex(slots)
+
+        found = index.overlap(
+            datetime(2026, 2, 6, 8, 0),
+            datetime(2026, 2, 6, 22, 0),
+        )
+
+        assert [s.start for s in found] == [
+            datetime(2026, 2, 5, 23, 0),
+            datetime(2026, 2, 6, 10, 0),
+        ]
+
+    def test_empty_index(self):
+        """Test querying an index with no events."""
+        index = IntervalIndex([])
+
+        assert len(index) == 0
+        assert index.overlap(datetime(2026, 2, 6, 8), datetime(2026, 2, 6, 22)) == []
@@ -17,7 +17,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from orchestrator import run_study_planner, run_study_planner_with_course_id
-from agents.course_ingestion.services.database_service import DatabaseService
+from agents.course_ingestion.services.database_service import get_database_service
 
 
 def test_with_pdf():
@@ -79,10 +79,21 @@ def demonstrate_database_storage():
     print("🗄️  Database Storage Demonstration")
     print("=" * 50)
 
-    db = DatabaseService()
-
-    # Get all study plans (in a real app, you'd filter by user)
-    study_plans = list(db.study_plan_collection.find().limit(5))
+    db = get_database_service()
+
+    # Get the latest study plans (in a real app, you'd filter by user).
+    # Only the printed fields come back; tasks are counted server-side.
+    study_plans = list(db.study_plan_collection.aggregate([
+        {"$sort": {"_id": -1}},
+        {"$limit": 5},
+        {"$project": {
+            "course_id": 1,
+            "created_at": 1,
+            "task_graph.goal": 1,
+            "task_graph.total_estimated_minutes": 1,
+            "task_count": {"$size": {"$ifNull": ["$task_graph.tasks", []]}},
+        }},
+    ]))
 
     print(f"📊 Found {len(study_plans)} study plans in database")
     print()
@@ -92,7 +103,7 @@ def demonstrate_database_storage():
         print(f"  🆔 ID: {plan['_id']}")
         print(f"  📚 Course ID: {plan.get('course_id', 'N/A')}")
         print(f"  🎯 Goal: {plan['task_graph']['goal']}")
-        print(f"  📝 Tasks: {len(plan['task_graph']['tasks'])}")
+        print(f"  📝 Tasks: {plan['task_count']}")
         print(f"  ⏰ Total time: {plan['task_graph']['total_estimated_minutes']} min")
         print(f"  📅 Created: {plan.get('created_at', 'N/A')}")
         print()
@@ -103,10 +114,10 @@ def test_with_existing_course():
     print("🔄 Testing with Existing Course ID")
     print("=" * 50)
 
-    db = DatabaseService()
+    db = get_database_service()
 
-    # Get the most recent course
-    recent_course = db.collection.find_one(sort=[("_id", -1)])
+    # Get the most recent course id without pulling its topic tree
+    recent_course = db.collection.find_one({}, {"_id": 1}, sort=[("_id", -1)])
     if not recent_course:
         print("❌ No courses found in database")
         return
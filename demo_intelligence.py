@@ -21,73 +21,73 @@ def old_hardcoded_response(fatigue_prob: float, focus_state: str, affective_stat
             "reasoning": "Student shows good engagement."
         })
 
-def new_intelligent_response(fatigue_prob: float, focus_state: str, focus_score: float,
-                           affective_state: str, is_late: bool) -> str:
-    """New intelligent approach - multi-factor analysis with severity scoring"""
 
-    # Intelligent severity scoring (0-10 scale)
-    severity_score = 0
+# Severity points per categorical signal, looked up once per call
+FOCUS_POINTS = {"Lost": 3, "Drifting": 1}
+AFFECT_POINTS = {"frustrated": 2, "stressed": 2, "bored": 1}
 
-    # Focus issues (0-3 points)
-    if focus_state == "Lost":
-        severity_score += 3
-    elif focus_state == "Drifting":
-        severity_score += 2 if focus_score < 0.4 else 1
 
-    # Fatigue impact (0-3 points)
-    if fatigue_prob > 0.8:
-        severity_score += 3
-    elif fatigue_prob > 0.6:
-        severity_score += 2
+def _render(action: str, message: str | None, reasoning: str) -> str:
+    """Serialize a decision to the JSON string the demo prints."""
+    return json.dumps({
+        "action": action,
+        "message": message,
+        "reasoning": reasoning
+    })
+
 
-    # Emotional state impact (0-2 points)
-    if affective_state in ["frustrated", "stressed"]:
-        severity_score += 2
-    elif affective_state == "bored":
-        severity_score += 1
+def new_intelligent_response(fatigue_prob: float, focus_state: str, focus_score: float,
+                           affective_state: str, is_late: bool) -> str:
+    """New intelligent approach - multi-factor analysis with severity scoring"""
 
-    # Time factor bonus (0-2 points)
-    if is_late and fatigue_prob > 0.7:
-        severity_score += 2
+    # Intelligent severity scoring (0-10 scale): focus (0-3), fatigue (0-3),
+    # emotional state (0-2) and a late-hour bonus (0-2)
+    severity_score = (
+        FOCUS_POINTS.get(focus_state, 0)
+        + (1 if focus_state == "Drifting" and focus_score < 0.4 else 0)
+        + (3 if fatigue_prob > 0.8 else 2 if fatigue_prob > 0.6 else 0)
+        + AFFECT_POINTS.get(affective_state, 0)
+        + (2 if is_late and fatigue_prob > 0.7 else 0)
+    )
 
     # Deep focus protection - never interrupt high focus
     if focus_state == "Focused" and focus_score > 0.8:
-        return json.dumps({
-            "action": "silence",
-            "message": None,
-            "reasoning": f"Exceptional focus (score: {focus_score:.1f}) in flow state. Severity: {severity_score}/10."
-        })
+        return _render(
+            "silence",
+            None,
+            f"Exceptional focus (score: {focus_score:.1f}) in flow state. Severity: {severity_score}/10."
+        )
 
     # Critical fatigue + late night = session suspension
     if fatigue_prob > 0.9 and is_late:
-        return json.dumps({
-            "action": "suspend_session",
-            "message": f"Fatigue level ({fatigue_prob:.1f}) + late hour requires session suspension.",
-            "reasoning": f"Critical threshold exceeded. Severity: {severity_score}/10."
-        })
+        return _render(
+            "suspend_session",
+            f"Fatigue level ({fatigue_prob:.1f}) + late hour requires session suspension.",
+            f"Critical threshold exceeded. Severity: {severity_score}/10."
+        )
 
     # High fatigue = break with appropriate duration
     if fatigue_prob > 0.7:
         break_duration = 10 if fatigue_prob > 0.8 else 5
-        return json.dumps({
-            "action": "add_break",
-            "message": f"Fatigue ({fatigue_prob:.1f}) suggests {break_duration}-minute break.",
-            "reasoning": f"Strategic intervention needed. Severity: {severity_score}/10."
-        })
+        return _render(
+            "add_break",
+            f"Fatigue ({fatigue_prob:.1f}) suggests {break_duration}-minute break.",
+            f"Strategic intervention needed. Severity: {severity_score}/10."
+        )
 
     # Emotional support for challenging states
     if affective_state == "frustrated" and focus_state == "Lost":
-        return json.dumps({
-            "action": "encourage",
-            "message": "Your persistence despite frustration shows dedication.",
-            "reasoning": f"Emotional support prioritized. Severity: {severity_score}/10."
-        })
-
-    return json.dumps({
-        "action": "encourage",
-        "message": "Good progress with balanced engagement.",
-        "reasoning": f"Stable state maintained. Severity: {severity_score}/10."
-    })
+        return _render(
+            "encourage",
+            "Your persistence despite frustration shows dedication.",
+            f"Emotional support prioritized. Severity: {severity_score}/10."
+        )
+
+    return _render(
+        "encourage",
+        "Good progress with balanced engagement.",
+        f"Stable state maintained. Severity: {severity_score}/10."
+    )
 
 # Test scenarios
 test_cases = [
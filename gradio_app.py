@@ -1,10 +1,163 @@
 """
 Gradio interface for Study Partner AI with JSON input
 """
+import os
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+
 import gradio as gr
+import orjson
 from agents.planner.agent import PlannerAgent
 from agents.planner.models.task_graph import PlannerInput
 
+# Tokens the JSON cleanup scanner stops at; everything else is copied in runs
+_CITATION = re.compile(r"\[cite[^\]]*\]")
+_OUTSIDE_STRING = re.compile(r'["/,\[]')
+_INSIDE_STRING = re.compile(r'["\\\[]')
+_WHITESPACE = re.compile(r"\s*")
+
+# Plans generated at once, and requests allowed to wait behind them
+GRADIO_CONCURRENCY = int(os.getenv("GRADIO_CONCURRENCY", "2"))
+GRADIO_MAX_QUEUE = int(os.getenv("GRADIO_MAX_QUEUE", "32"))
+
+# Largest subject JSON accepted, checked before any cleanup or parsing
+MAX_SUBJECT_JSON_CHARS = 1_000_000
+
+
+def _skip_insignificant(text: str, i: int) -> int:
+    """Return the index of the next character that is not whitespace, a comment or a citation."""
+    n = len(text)
+    while i < n:
+        i = _WHITESPACE.match(text, i).end()
+        if text.startswith("//", i):
+            end = text.find("\n", i)
+            i = n if end == -1 else end
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        else:
+            citation = _CITATION.match(text, i)
+            if not citation:
+                break
+            i = citation.end()
+    return i
+
+
+def _strip_jsonc(text: str) -> str:
+    """
+    Turn the relaxed JSON users paste into strict JSON in a single pass.
+
+    Removes a leading BOM, citation markers like [cite_start] or [cite: 123],
+    // and /* */ comments and trailing commas before } or ]. Comment markers
+    inside string values (e.g. URLs) are left untouched.
+    """
+    if text.startswith("\ufeff"):
+        text = text[1:]
+
+    parts = []
+    n = len(text)
+    i = start = 0
+    in_string = False
+
+    while True:
+        match = (_INSIDE_STRING if in_string else _OUTSIDE_STRING).search(text, i)
+        if match is None:
+            break
+        j = match.start()
+        ch = text[j]
+
+        if ch == "[":
+            citation = _CITATION.match(text, j)
+            if citation:
+                parts.append(text[start:j])
+                start = i = citation.end()
+            else:
+                i = j + 1
+        elif in_string:
+            if ch == "\\":
+                i = j + 2  # skip the escaped character
+            else:
+                in_string = False
+                i = j + 1
+        elif ch == '"':
+            in_string = True
+            i = j + 1
+        elif ch == ",":
+            k = _skip_insignificant(text, j + 1)
+            if k < n and text[k] in "}]":
+                parts.append(text[start:j])
+                start = j + 1
+            i = j + 1
+        elif text.startswith("//", j):
+            end = text.find("\n", j)
+            end = n if end == -1 else end
+            parts.append(text[start:j])
+            start = i = end
+        elif text.startswith("/*", j):
+            end = text.find("*/", j + 2)
+            end = n if end == -1 else end + 2
+            parts.append(text[start:j])
+            start = i = end
+        else:
+            i = j + 1
+
+    parts.append(text[start:])
+    return "".join(parts)
+
+
+def _iter_course_documents(subject_details: dict):
+    """Yield candidate document strings from subject_details in index order."""
+    # Syllabus topics
+    for chapter in subject_details.get('syllabus', ()):
+        if 'topics' in chapter and isinstance(chapter['topics'], list):
+            yield from chapter['topics']
+
+    # Learning outcomes descriptions
+    for outcome in subject_details.get('learning_outcomes', ()):
+        if 'description' in outcome:
+            yield outcome['description']
+
+    # General objective
+    if 'general_objective' in subject_details:
+        yield subject_details['general_objective']
+
+    # Prerequisites
+    prerequisites = subject_details.get('prerequisites')
+    if isinstance(prerequisites, list):
+        yield from prerequisites
+
+
+@lru_cache(maxsize=32)
+def _extract_course_documents(subject_json: str) -> tuple[str, ...]:
+    """
+    Parse pasted subject JSON into the course documents to index.
+
+    Cached on the raw text, so clicking "Generate" again with the same
+    syllabus (and a different goal or time) skips cleanup and parsing.
+
+    Raises:
+        orjson.JSONDecodeError: If the text is not valid JSON after cleanup
+        ValueError: If subject_details is missing or holds no usable text
+    """
+    # Strip BOM, citation markers, comments and trailing commas
+    subject_data = orjson.loads(_strip_jsonc(subject_json))
+
+    # Extract documents from subject_details
+    if 'subject_details' not in subject_data:
+        raise ValueError('JSON must contain a "subject_details" object.')
+
+    # Filter out empty strings while walking the details once
+    course_documents = tuple(
+        doc for doc in _iter_course_documents(subject_data['subject_details'])
+        if doc and doc.strip()
+    )
+
+    if not course_documents:
+        raise ValueError("No valid content found in JSON.")
+
+    return course_documents
+
 
 def create_study_plan(goal: str, available_time: int, subject_json: str = "") -> str:
     """
@@ -25,6 +178,12 @@ def create_study_plan(goal: str, available_time: int, subject_json: str = "") ->
     if available_time < 30:
         return "❌ **Error:** Available time must be at least 30 minutes."
 
+    if subject_json and len(subject_json) > MAX_SUBJECT_JSON_CHARS:
+        return (
+            f"❌ **Error:** Subject JSON is too large "
+            f"(limit is {MAX_SUBJECT_JSON_CHARS:,} characters)."
+        )
+
     try:
         # Initialize agent
         agent = PlannerAgent()
@@ -33,63 +192,10 @@ def create_study_plan(goal: str, available_time: int, subject_json: str = "") ->
         course_documents = None
         
         if subject_json and subject_json.strip():
-            import json
-            import re
             try:
-                # Remove BOM if present
-                if cleaned_json.startswith('\ufeff'):
-                    cleaned_json = cleaned_json[1:]
-                
-                # Remove citation markers like [cite_start] or [cite: 123]
-                cleaned_json = re.sub(r'\[cite[^\]]*\]', '', cleaned_json)
-                
-                # Remove single-line comments (// ...)
-                cleaned_json = re.sub(r'//.*', '', cleaned_json)
-                
-                # Remove multi-line comments (/* ... */)
-                cleaned_json = re.sub(r'/\*.*?\*/', '', cleaned_json, flags=re.DOTALL)
-                
-                # Remove trailing commas before closing brackets
-                cleaned_json = re.sub(r',(\s*[}\]])', r'\1', cleaned_json)
-                
-                subject_data = json.loads(cleaned_json)
-                
-                # Extract documents from subject_details
-                if 'subject_details' in subject_data:
-                    subject_details = subject_data['subject_details']
-                    course_documents = []
-                    
-                    # Extract syllabus topics
-                    if 'syllabus' in subject_details:
-                        for chapter in subject_details['syllabus']:
-                            if 'topics' in chapter and isinstance(chapter['topics'], list):
-                                course_documents.extend(chapter['topics'])
-                    
-                    # Add learning outcomes descriptions
-                    if 'learning_outcomes' in subject_details:
-                        for outcome in subject_details['learning_outcomes']:
-                            if 'description' in outcome:
-                                course_documents.append(outcome['description'])
-                    
-                    # Add general objective
-                    if 'general_objective' in subject_details:
-                        course_documents.append(subject_details['general_objective'])
-                    
-                    # Add prerequisites
-                    if 'prerequisites' in subject_details and isinstance(subject_details['prerequisites'], list):
-                        course_documents.extend(subject_details['prerequisites'])
-                    
-                    # Filter out empty strings
-                    course_documents = [doc for doc in course_documents if doc and doc.strip()]
-                    
-                    if not course_documents:
-                        return '❌ **Error:** No valid content found in JSON.'
-                    
-                    print(f"✅ Loaded {len(course_documents)} document(s) from subject details")
-                else:
-                    return '❌ **Error:** JSON must contain a "subject_details" object.'
-                    
-            except json.JSONDecodeError as e:
+                course_documents = list(_extract_course_documents(subject_json))
+                print(f"✅ Loaded {len(course_documents)} document(s) from subject details")
+            except orjson.JSONDecodeError as e:
                 error_msg = f"❌ **Error:** Invalid JSON format.\n\n"
                 error_msg += f"**Details:** {str(e)}\n\n"
                 error_msg += "**Tips:**\n"
@@ -98,11 +204,12 @@ def create_study_plan(goal: str, available_time: int, subject_json: str = "") ->
                 error_msg += "- Check for unescaped special characters\n"
                 error_msg += "- Verify all brackets {{ }} and [ ] are properly closed"
                 return error_msg
+            except ValueError as e:
+                return f"❌ **Error:** {e}"
         else:
             return '❌ **Error:** Please provide JSON with subject details.'
 
         # Create request
-        from datetime import datetime, timedelta
         deadline = (datetime.now() + timedelta(days=7)).isoformat()
 
         request = PlannerInput(
@@ -119,38 +226,104 @@ def create_study_plan(goal: str, available_time: int, subject_json: str = "") ->
         output = agent.plan(request)
 
         # Format output
-        result = f"🎯 **Goal:** {output.task_graph.goal}\n\n"
-        result += f"📊 **Tasks Generated:** {len(output.task_graph.tasks)}\n"
-        result += f"⏱️ **Total Time:** {output.task_graph.total_estimated_minutes} min\n\n"
+        parts = []
+        append = parts.append
+        append(f"🎯 **Goal:** {output.task_graph.goal}\n\n")
+        append(f"📊 **Tasks Generated:** {len(output.task_graph.tasks)}\n")
+        append(f"⏱️ **Total Time:** {output.task_graph.total_estimated_minutes} min\n\n")
         
         if course_documents:
-            result += f"📚 **Course Documents:** {len(course_documents)} document(s) indexed\n\n"
+            append(f"📚 **Course Documents:** {len(course_documents)} document(s) indexed\n\n")
 
         if hasattr(output, 'warning') and output.warning:
-            result += f"⚠️ **Warning:** {output.warning}\n\n"
+            append(f"⚠️ **Warning:** {output.warning}\n\n")
 
-        result += "## 📝 Study Tasks:\n\n"
+        append("## 📝 Study Tasks:\n\n")
 
         for i, task in enumerate(output.task_graph.tasks, 1):
-            result += f"### {i}. {task.title}\n"
-            result += f"- **Description:** {task.description}\n"
-            result += f"- **Duration:** {task.estimated_minutes} minutes\n"
-            result += f"- **Difficulty:** {task.difficulty:.1f}/1.0\n"
+            append(f"### {i}. {task.title}\n")
+            append(f"- **Description:** {task.description}\n")
+            append(f"- **Duration:** {task.estimated_minutes} minutes\n")
+            append(f"- **Difficulty:** {task.difficulty:.1f}/1.0\n")
             if task.is_review:
-                result += "- **Type:** Review Session ✨\n"
+                append("- **Type:** Review Session ✨\n")
             if task.prerequisites:
-                result += f"- **Prerequisites:** {len(task.prerequisites)} task(s)\n"
-            result += "\n"
+                append(f"- **Prerequisites:** {len(task.prerequisites)} task(s)\n")
+            append("\n")
 
         if output.clarification_required:
-            result += "\n❓ **Note:** Some tasks may need clarification. Consider providing more specific learning goals."
+            append("\n❓ **Note:** Some tasks may need clarification. Consider providing more specific learning goals.")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         return f"❌ **Error:** {str(e)}\n\nPlease try again with a different goal or contact support if the issue persists."
 
 
+# Static interface content, built once at import
+_WELCOME_MD = """
+### Welcome to Study Partner AI! 👋
+
+**Get Started:**
+1. Enter your learning goal
+2. Set your available time
+3. (Optional) Paste JSON with subject information
+4. Click "Generate Study Plan"
+
+**JSON Format Example:**
+```json
+{
+  "documents": [
+    "Python basics: variables, data types, functions",
+    "Object-oriented programming concepts",
+    "File I/O and error handling"
+  ]
+}
+```
+
+The AI will analyze your goal and create a personalized study plan!
+"""
+
+_HELP_MD = """
+        ---
+        ### 📖 How it works:
+        1. **Input your learning goal** - Be specific about what you want to learn
+        2. **Set available time** - How many minutes you have for studying
+        3. **Paste JSON with subject info** (Optional) - Course materials and documents
+        4. **Get personalized tasks** - AI breaks down your goal into manageable study sessions
+        5. **Follow the plan** - Each task includes time estimates and difficulty levels
+
+        ### 🔧 Features:
+        - ✅ AI-powered task decomposition
+        - ✅ JSON-based knowledge input
+        - ✅ RAG-based knowledge retrieval
+        - ✅ Time-aware planning
+        - ✅ Difficulty assessment
+        - ✅ Prerequisite tracking
+        - ✅ Review session suggestions
+        
+        ### 📄 JSON Input Format:
+        The optional JSON input allows you to provide course materials:
+        ```json
+        {
+          "documents": [
+            "First topic or chapter content",
+            "Second topic or chapter content",
+            "Third topic or chapter content"
+          ]
+        }
+        ```
+        Simply paste an array of text strings containing your course materials.
+        """
+
+_EXAMPLES = [
+    ["Learn Python programming fundamentals", 90, ""],
+    ["Master Linear Algebra for Machine Learning", 180, ""],
+    ["Understand Neural Networks basics", 120, ""],
+    ["Learn Data Structures and Algorithms", 150, '{"documents": ["Arrays and linked lists", "Stacks and queues", "Trees and graphs"]}']
+]
+
+
 def main():
     """Main function to run the Gradio interface."""
 
@@ -184,7 +357,7 @@ def main():
                     label="Subject JSON",
                     placeholder='{\n  "documents": [\n    "Introduction to...",\n    "Chapter 1..."\n  ]\n}',
                     lines=8,
-                    info="Paste JSON containing subject documents"
+                    info=f"Paste JSON containing subject documents (up to {MAX_SUBJECT_JSON_CHARS:,} characters)"
                 )
 
                 generate_btn = gr.Button("🚀 Generate Study Plan", variant="primary", size="lg")
@@ -192,28 +365,7 @@ def main():
             with gr.Column(scale=2):
                 gr.Markdown("### 📊 Study Plan")
                 output_display = gr.Markdown(
-                    value="""
-### Welcome to Study Partner AI! 👋
-
-**Get Started:**
-1. Enter your learning goal
-2. Set your available time
-3. (Optional) Paste JSON with subject information
-4. Click "Generate Study Plan"
-
-**JSON Format Example:**
-```json
-{
-  "documents": [
-    "Python basics: variables, data types, functions",
-    "Object-oriented programming concepts",
-    "File I/O and error handling"
-  ]
-}
-```
-
-The AI will analyze your goal and create a personalized study plan!
-                    """
+                    value=_WELCOME_MD
                 )
 
         # Connect the function
@@ -225,46 +377,14 @@ The AI will analyze your goal and create a personalized study plan!
 
         # Examples
         gr.Examples(
-            examples=[
-                ["Learn Python programming fundamentals", 90, ""],
-                ["Master Linear Algebra for Machine Learning", 180, ""],
-                ["Understand Neural Networks basics", 120, ""],
-                ["Learn Data Structures and Algorithms", 150, '{"documents": ["Arrays and linked lists", "Stacks and queues", "Trees and graphs"]}']
-            ],
+            examples=_EXAMPLES,
             inputs=[goal_input, time_input, json_input]
         )
 
-        gr.Markdown("""
-        ---
-        ### 📖 How it works:
-        1. **Input your learning goal** - Be specific about what you want to learn
-        2. **Set available time** - How many minutes you have for studying
-        3. **Paste JSON with subject info** (Optional) - Course materials and documents
-        4. **Get personalized tasks** - AI breaks down your goal into manageable study sessions
-        5. **Follow the plan** - Each task includes time estimates and difficulty levels
+        gr.Markdown(_HELP_MD)
 
-        ### 🔧 Features:
-        - ✅ AI-powered task decomposition
-        - ✅ JSON-based knowledge input
-        - ✅ RAG-based knowledge retrieval
-        - ✅ Time-aware planning
-        - ✅ Difficulty assessment
-        - ✅ Prerequisite tracking
-        - ✅ Review session suggestions
-        
-        ### 📄 JSON Input Format:
-        The optional JSON input allows you to provide course materials:
-        ```json
-        {
-          "documents": [
-            "First topic or chapter content",
-            "Second topic or chapter content",
-            "Third topic or chapter content"
-          ]
-        }
-        ```
-        Simply paste an array of text strings containing your course materials.
-        """)
+    # Queue requests so bursts wait their turn instead of piling up planners
+    interface.queue(default_concurrency_limit=GRADIO_CONCURRENCY, max_size=GRADIO_MAX_QUEUE)
 
     # Launch the interface
     interface.launch(
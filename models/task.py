@@ -1,7 +1,7 @@
 """Task model."""
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Task(BaseModel):
@@ -38,7 +38,7 @@ class Task(BaseModel):
     )
     
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Creation timestamp"
     )
     started_at: Optional[datetime] = Field(
@@ -60,8 +60,8 @@ class Task(BaseModel):
         description="List of task IDs that must be completed before this task"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "task_id": "task_xyz789",
                 "user_id": "user123",
@@ -75,3 +75,4 @@ class Task(BaseModel):
                 "tags": ["python", "basics", "variables"]
             }
         }
+    )
@@ -4,15 +4,36 @@ This service integrates signal processing with the Coach agent,
 fetching both scheduled tasks and ML signals before running the coach.
 """
 
+import asyncio
+import logging
+import operator
+import threading
+import time
 from typing import Optional, Any
 from datetime import datetime
 
 from agents.coach.agent import run_coach
 from agents.coach.models.schemas import CoachInput, CoachAction, ScheduledTask, FocusState, FatigueState
-from agents.coach.services.planner_repository import PlannerRepository
+from agents.coach.services.planner_repository import get_planner_repository
 from services.signal_processing_service.service import SignalProcessingService
 from services.signal_processing_service.signal_snapshot import SignalSnapshot
 
+logger = logging.getLogger(__name__)
+
+# Snapshots older than this are regenerated; younger ones are reused
+SNAPSHOT_MAX_AGE_SECONDS = 120
+_SNAPSHOT_CACHE_SIZE = 1024
+
+# The SignalSnapshot fields the coach input is built from, read in one call
+_signal_states = operator.attrgetter(
+    "focus_state", "focus_score", "fatigue_state", "fatigue_score"
+)
+
+
+def _stored_time(timestamp: datetime) -> datetime:
+    """Return a timestamp as MongoDB stores it, truncated to milliseconds."""
+    return timestamp.replace(microsecond=timestamp.microsecond // 1000 * 1000)
+
 
 class AIOrchestrator:
     """
@@ -29,7 +50,10 @@ class AIOrchestrator:
     def __init__(self):
         """Initialize the orchestrator with required services."""
         self.signal_service = SignalProcessingService()
-        self.planner_repo = PlannerRepository()
+        self.planner_repo = get_planner_repository()
+        # user_id -> (monotonic expiry, snapshot), oldest entry first
+        self._snapshot_cache: dict[str, tuple[float, SignalSnapshot]] = {}
+        self._snapshot_cache_lock = threading.Lock()
     
     def run_coach(
         self, 
@@ -50,17 +74,92 @@ class AIOrchestrator:
         Returns:
             A CoachAction containing the coach's decision
         """
-        if current_time is None:
-            current_time = datetime.now()
-        
         # Step 1: Fetch scheduled tasks from MongoDB
-        print(f"Fetching scheduled tasks for user {user_id}...")
+        logger.debug("Fetching scheduled tasks for user %s", user_id)
         scheduled_tasks = self._fetch_scheduled_tasks()
         
         # Step 2: Fetch or generate signal snapshot
-        print(f"Fetching signal snapshot for user {user_id}...")
+        logger.debug("Fetching signal snapshot for user %s", user_id)
         signal_snapshot = self._fetch_signal_snapshot(user_id)
         
+        return self._decide(
+            user_id=user_id,
+            scheduled_tasks=scheduled_tasks,
+            signal_snapshot=signal_snapshot,
+            current_time=current_time,
+            ignored_count=ignored_count,
+            do_not_disturb=do_not_disturb
+        )
+
+    async def arun_coach(
+        self,
+        user_id: str,
+        current_time: Optional[datetime] = None,
+        ignored_count: int = 0,
+        do_not_disturb: bool = False
+    ) -> CoachAction:
+        """
+        Async variant of run_coach for use from the API.
+
+        The task and signal lookups run concurrently in worker threads, and
+        the coach itself runs in a thread too, so the event loop is never
+        blocked on MongoDB or model inference.
+
+        Args:
+            user_id: The user's unique identifier
+            current_time: The current time (defaults to now)
+            ignored_count: Number of times user has ignored recent nudges
+            do_not_disturb: Whether user has enabled DND mode
+
+        Returns:
+            A CoachAction containing the coach's decision
+        """
+        # Steps 1-2: fetch scheduled tasks and signal snapshot together
+        logger.debug("Fetching scheduled tasks and signal snapshot for user %s", user_id)
+        scheduled_tasks, signal_snapshot = await asyncio.gather(
+            asyncio.to_thread(self._fetch_scheduled_tasks),
+            asyncio.to_thread(self._fetch_signal_snapshot, user_id),
+        )
+
+        return await asyncio.to_thread(
+            self._decide,
+            user_id=user_id,
+            scheduled_tasks=scheduled_tasks,
+            signal_snapshot=signal_snapshot,
+            current_time=current_time,
+            ignored_count=ignored_count,
+            do_not_disturb=do_not_disturb
+        )
+
+    def _decide(
+        self,
+        user_id: str,
+        scheduled_tasks: list[ScheduledTask],
+        signal_snapshot: Optional[SignalSnapshot],
+        current_time: Optional[datetime],
+        ignored_count: int,
+        do_not_disturb: bool
+    ) -> CoachAction:
+        """
+        Build the CoachInput from fetched data and execute the Coach agent.
+
+        Shared by run_coach and arun_coach, which differ only in how they
+        fetch the tasks and snapshot.
+
+        Args:
+            user_id: The user's unique identifier
+            scheduled_tasks: List of scheduled tasks
+            signal_snapshot: Optional signal snapshot
+            current_time: The current time (defaults to now)
+            ignored_count: Number of ignored nudges
+            do_not_disturb: DND flag
+
+        Returns:
+            A CoachAction containing the coach's decision
+        """
+        if current_time is None:
+            current_time = datetime.now()
+
         # Step 3: Build CoachInput
         coach_input = self._build_coach_input(
             user_id=user_id,
@@ -70,12 +169,13 @@ class AIOrchestrator:
             ignored_count=ignored_count,
             do_not_disturb=do_not_disturb
         )
-        
-        # Step 4: Execute Coach agent
-        print("Executing Coach agent...")
-        coach_action = run_coach(coach_input)
-        
-        print(f"Coach decision: {coach_action.action_type}")
+
+        # Step 4: Execute Coach agent. The tasks were fetched above, so the
+        # agent does not load them again.
+        logger.debug("Executing Coach agent")
+        coach_action = run_coach(coach_input, fetch_tasks=False)
+
+        logger.debug("Coach decision: %s", coach_action.action_type)
         return coach_action
     
     def _fetch_scheduled_tasks(self) -> list[ScheduledTask]:
@@ -92,7 +192,7 @@ class AIOrchestrator:
             tasks = self.planner_repo.get_scheduled_tasks()
             return tasks if tasks else []
         except Exception as e:
-            print(f"Warning: Could not fetch scheduled tasks: {e}")
+            logger.warning("Could not fetch scheduled tasks: %s", e)
             return []
     
     def _fetch_signal_snapshot(self, user_id: str) -> Optional[SignalSnapshot]:
@@ -106,23 +206,42 @@ class AIOrchestrator:
             SignalSnapshot if available, None otherwise
         """
         try:
+            cached = self._snapshot_cache.get(user_id)
+            if cached is not None and time.monotonic() < cached[0]:
+                # Another service or worker may have saved a newer snapshot;
+                # checking only its timestamp still skips loading and parsing
+                latest_time = self.signal_service.get_latest_snapshot_time(user_id)
+                if latest_time == _stored_time(cached[1].timestamp):
+                    return cached[1]
+
             # Try to get the latest snapshot
             snapshot = self.signal_service.get_latest_snapshot(user_id)
             
             # If no snapshot exists or it's too old, generate a new one
             if snapshot is None:
-                print("No signal snapshot found, generating new one...")
+                logger.debug("No signal snapshot found, generating new one")
                 snapshot = self.signal_service.get_current_signal_snapshot(user_id)
+                age_seconds = 0.0
             else:
                 # Check if snapshot is recent (within 2 minutes)
                 age_seconds = (datetime.now() - snapshot.timestamp).total_seconds()
-                if age_seconds > 120:  # 2 minutes
-                    print(f"Signal snapshot is {age_seconds:.0f}s old, generating new one...")
+                if age_seconds > SNAPSHOT_MAX_AGE_SECONDS:
+                    logger.debug("Signal snapshot is %.0fs old, generating new one", age_seconds)
                     snapshot = self.signal_service.get_current_signal_snapshot(user_id)
+                    age_seconds = 0.0
             
+            if snapshot is not None:
+                # Reuse it only for what is left of its freshness window
+                expires_at = time.monotonic() + SNAPSHOT_MAX_AGE_SECONDS - age_seconds
+                with self._snapshot_cache_lock:
+                    self._snapshot_cache.pop(user_id, None)
+                    self._snapshot_cache[user_id] = (expires_at, snapshot)
+                    if len(self._snapshot_cache) > _SNAPSHOT_CACHE_SIZE:
+                        del self._snapshot_cache[next(iter(self._snapshot_cache))]
+
             return snapshot
         except Exception as e:
-            print(f"Warning: Could not fetch signal snapshot: {e}")
+            logger.warning("Could not fetch signal snapshot: %s", e)
             return None
     
     def _build_coach_input(
@@ -148,21 +267,18 @@ class AIOrchestrator:
         Returns:
             A fully populated CoachInput
         """
-        # Extract focus state from signals (or use defaults)
+        # Extract focus state from signals (or use defaults). SignalSnapshot
+        # already enforces the same states and score ranges, so these are
+        # built without a second validation pass.
         if signal_snapshot is not None:
-            focus_state = FocusState(
-                state=signal_snapshot.focus_state,
-                score=signal_snapshot.focus_score
-            )
+            focus, focus_score, fatigue, fatigue_score = _signal_states(signal_snapshot)
+            focus_state = FocusState.model_construct(state=focus, score=focus_score)
             # Extract fatigue data from signals
-            fatigue_state = FatigueState(
-                state=signal_snapshot.fatigue_state,
-                score=signal_snapshot.fatigue_score
-            )
+            fatigue_state = FatigueState.model_construct(state=fatigue, score=fatigue_score)
         else:
             # Default to neutral state if no signals available
-            focus_state = FocusState(state="Drifting", score=0.5)
-            fatigue_state = FatigueState(state="Moderate", score=0.3)
+            focus_state = FocusState.model_construct(state="Drifting", score=0.5)
+            fatigue_state = FatigueState.model_construct(state="Moderate", score=0.3)
         affective_state = "engaged"  # Mock value
         
         # Determine if user is late (simple check)
@@ -195,7 +311,4 @@ class AIOrchestrator:
         Returns:
             True if user is late for any task, False otherwise
         """
-        for task in scheduled_tasks:
-            if current_time > task.start_time:
-                return True
-        return False
+        return any(current_time > task.start_time for task in scheduled_tasks)
@@ -3,12 +3,17 @@
 This service provides RESTful endpoints for the frontend to interact with all AI agents.
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form, BackgroundTasks
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Query, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import asyncio
 import tempfile
+import time
 import os
 import sys
 from pathlib import Path
@@ -17,17 +22,12 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from agents.course_ingestion.agent import ingest_course
 from agents.course_ingestion.enrichment.task_generator import generate_tasks_from_course, generate_tasks_simple
-from agents.course_ingestion.services.database_service import DatabaseService
-from agents.planner.agent import PlannerAgent
-from agents.planner.models.task_graph import PlannerInput
-from services.ai_orchestrator.orchestrator import AIOrchestrator
-from services.schedule_orchestrator.orchestrator import ScheduleOrchestrator
-# from services.signal_processing_service.service import SignalProcessingService  # Disabled to prevent crashes
+from agents.course_ingestion.services.database_service import get_database_service
+from agents.coach.models.schemas import CoachAction
+from services.db import get_mongo_client
 from services.signal_processing_service.focus_detector import get_focus_detector
 from services.signal_processing_service.fatigue_detector import get_fatigue_detector
-from pymongo import MongoClient
 from bson import ObjectId
 import logging
 
@@ -45,14 +45,27 @@ def convert_objectid_to_str(obj):
     else:
         return obj
 
-app = FastAPI(title="Study Partner AI API", version="1.0.0")
+app = FastAPI(
+    title="Study Partner AI API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # MongoDB connection (only for AI-specific data)
-MONGO_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
-mongo_client = MongoClient(MONGO_URI)
+mongo_client = get_mongo_client()
 db = mongo_client["study_partner"]
 signals_collection = db["signals"]
 
+# Uploaded course files are copied to disk in pieces of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# The UI polls current signals faster than snapshots change, so each reply is
+# reused for a short while; writes to the signals collection drop it early
+SIGNALS_CACHE_SECONDS = 2
+_SIGNALS_CACHE_SIZE = 1024
+# user_id -> (monotonic expiry, reply), oldest entry first
+_signals_cache: dict = {}
+
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
@@ -62,33 +75,69 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services (lazy-load to avoid crashes)
+# Compress larger JSON replies (signal history, plans); small ones go as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Initialize services (lazy-load to avoid crashes). Heavy modules (embedding
+# models, Mongo-backed orchestrators) are imported on first use, not at boot.
 _planner_agent = None
 _ai_orchestrator = None
 _schedule_orchestrator = None
+_scheduling_service = None
+_signal_service = None
 
 def get_planner_agent():
     global _planner_agent
     if _planner_agent is None:
+        from agents.planner.agent import PlannerAgent
         _planner_agent = PlannerAgent()
     return _planner_agent
 
 def get_ai_orchestrator():
     global _ai_orchestrator
     if _ai_orchestrator is None:
+        from services.ai_orchestrator.orchestrator import AIOrchestrator
         _ai_orchestrator = AIOrchestrator()
     return _ai_orchestrator
 
 def get_schedule_orchestrator():
     global _schedule_orchestrator
     if _schedule_orchestrator is None:
+        from services.schedule_orchestrator.orchestrator import ScheduleOrchestrator
         _schedule_orchestrator = ScheduleOrchestrator()
     return _schedule_orchestrator
 
+def get_scheduling_service():
+    global _scheduling_service
+    if _scheduling_service is None:
+        from agents.planner.rag.prompt_builder import SchedulingService
+        _scheduling_service = SchedulingService()
+    return _scheduling_service
+
 
 def get_signal_service():
-    """Signal service disabled to prevent crashes."""
-    return None
+    global _signal_service
+    if _signal_service is None:
+        # The service catches its own ML adapter failures and still serves
+        # stored snapshots from Mongo
+        from services.signal_processing_service.service import SignalProcessingService
+        _signal_service = SignalProcessingService()
+    return _signal_service
+
+
+@app.on_event("startup")
+async def warm_services():
+    """Build the lazy services at boot when WARM_ON_STARTUP=1 (e.g. in production)."""
+    if os.getenv("WARM_ON_STARTUP") != "1":
+        return
+    await asyncio.gather(
+        asyncio.to_thread(get_planner_agent),
+        asyncio.to_thread(get_ai_orchestrator),
+        asyncio.to_thread(get_schedule_orchestrator),
+        asyncio.to_thread(get_scheduling_service),
+        asyncio.to_thread(get_signal_service),
+    )
+    logger.info("Services warmed on startup")
 
 
 # ==================== Pydantic Models ====================
@@ -123,8 +172,56 @@ class SignalProcessingRequest(BaseModel):
     user_id: str
 
 
+class SignalReading(BaseModel):
+    state: str
+    score: float
+    confidence: Optional[float] = None
+
+
+class SignalSnapshotResponse(BaseModel):
+    user_id: str
+    timestamp: datetime
+    focus: SignalReading
+    fatigue: SignalReading
+
+
+class SignalHistoryEntry(BaseModel):
+    timestamp: datetime
+    focus: SignalReading
+    fatigue: SignalReading
+
+
+class SignalHistoryResponse(BaseModel):
+    signals: List[SignalHistoryEntry]
+
+
+class CoachDecisionResponse(BaseModel):
+    coach_action: CoachAction
+    schedule_update: Optional[dict] = None
+
+
 # ==================== Course Ingestion Endpoints ====================
 
+async def _save_upload(file: UploadFile, temp_files: list) -> str:
+    """
+    Copy an uploaded file to a temporary path and return that path.
+
+    The path is recorded in temp_files as soon as it exists, so the caller
+    can remove it even if the copy fails halfway.
+    """
+    suffix = os.path.splitext(file.filename)[1]
+    fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    temp_files.append(temp_path)
+    # The buffered file writes each chunk in full (os.write may not) and
+    # closes the descriptor
+    with os.fdopen(fd, "wb") as out:
+        # Copy in chunks so large PDFs are never held in memory whole; disk
+        # writes go to the threadpool so several uploads can overlap
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await run_in_threadpool(out.write, chunk)
+    return temp_path
+
+
 @app.post("/api/ai/courses/ingest")
 async def ingest_course_endpoint(
     course_title: str = Form(...),
@@ -144,41 +241,42 @@ async def ingest_course_endpoint(
     Returns:
         Processed course data with topics, subtopics, etc.
     """
+    temp_files = []
     try:
-        # Save uploaded files temporarily
-        temp_files = []
-        for file in files:
-            suffix = os.path.splitext(file.filename)[1]
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                content = await file.read()
-                tmp.write(content)
-                temp_files.append(tmp.name)
-        
         try:
-            # Process course ingestion synchronously
-            course_id = ingest_course(course_title, temp_files)
+            # Save uploaded files temporarily, all at once
+            pdf_paths = list(await asyncio.gather(
+                *(_save_upload(file, temp_files) for file in files)
+            ))
+
+            # Process course ingestion in the threadpool so parsing, OCR and LLM
+            # enrichment do not stall other requests; the PDF/OCR stack loads
+            # on first upload
+            from agents.course_ingestion.agent import ingest_course
+
+            course_id = await run_in_threadpool(ingest_course, course_title, pdf_paths)
             
             # Get the processed course data
-            db = DatabaseService()
-            course_data = db.get_course_by_id(course_id)
+            db = get_database_service()
+            course_data = await run_in_threadpool(db.get_course_by_id, course_id)
             
             # Return course data with topics
             return {
                 "course_id": course_id,
                 "user_id": user_id,
                 "subject_id": subject_id,
-                "files_count": len(temp_files),
-                "processed_at": datetime.now().isoformat(),
+                "files_count": len(pdf_paths),
+                "processed_at": datetime.now(),
                 "course_title": course_title,
                 "topics": course_data.get("topics", []) if course_data else []
             }
             
         finally:
-            # Cleanup temp files
+            # Cleanup temp files, including any left by a failed upload
             for tmp_file in temp_files:
                 try:
                     os.unlink(tmp_file)
-                except:
+                except OSError:
                     pass
                     
     except Exception as e:
@@ -205,7 +303,7 @@ async def generate_tasks_from_course_endpoint(request: TaskGenerationRequest):
         
         # Generate tasks using AI
         try:
-            tasks = generate_tasks_from_course(course_title, topics)
+            tasks = await run_in_threadpool(generate_tasks_from_course, course_title, topics)
             
             # If AI generation fails, use fallback
             if not tasks:
@@ -249,9 +347,8 @@ async def create_study_plan(request: PlannerRequest):
         # Fetch course documents if course_id provided
         course_knowledge = None
         if request.course_id:
-            from agents.course_ingestion.services.database_service import DatabaseService
-            db_service = DatabaseService()
-            course = db_service.get_course_by_id(request.course_id)
+            db_service = get_database_service()
+            course = await run_in_threadpool(db_service.get_course_by_id, request.course_id)
             if course:
                 # Convert all ObjectIds to strings for JSON serialization
                 course_knowledge = convert_objectid_to_str(course)
@@ -276,6 +373,8 @@ async def create_study_plan(request: PlannerRequest):
         else:
             deadline_iso = (datetime.now() + timedelta(days=7)).isoformat()
         
+        from agents.planner.models.task_graph import PlannerInput
+
         planner_input = PlannerInput(
             goal=request.goal,
             deadline_iso=deadline_iso,
@@ -290,7 +389,7 @@ async def create_study_plan(request: PlannerRequest):
         
         # Generate plan using planner agent
         planner_agent = get_planner_agent()
-        plan_output = planner_agent.plan(planner_input)
+        plan_output = await run_in_threadpool(planner_agent.plan, planner_input)
         
         # Convert AtomicTasks to Task format for database
         tasks = []
@@ -328,12 +427,16 @@ async def create_study_plan(request: PlannerRequest):
 
 
 @app.get("/api/ai/planner/plans/{user_id}")
-async def get_user_plans(user_id: str):
-    """Get all study plans for a user."""
+async def get_user_plans(
+    user_id: str,
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    """Get a page of study plans for a user, newest first."""
     try:
-        from agents.planner.rag.prompt_builder import SchedulingService
-        scheduling_service = SchedulingService()
-        plans = scheduling_service.get_user_plans(user_id)
+        plans = await run_in_threadpool(
+            get_scheduling_service().get_user_plans, user_id, limit=limit, offset=offset
+        )
         return {"plans": plans}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch plans: {str(e)}")
@@ -341,7 +444,10 @@ async def get_user_plans(user_id: str):
 
 # ==================== Coach Endpoints ====================
 
-@app.post("/api/ai/coach/decision")
+@app.post(
+    "/api/ai/coach/decision",
+    response_model=CoachDecisionResponse,
+)
 async def get_coach_decision(request: CoachRequest):
     """
     Get real-time coaching decision based on current context.
@@ -353,30 +459,28 @@ async def get_coach_decision(request: CoachRequest):
         CoachAction with decision and optional schedule changes
     """
     try:
+        # One clock reading, so the decision and any schedule changes agree
+        now = datetime.now()
+
         # Run coach through orchestrator
-        coach_action = get_ai_orchestrator().run_coach(
+        coach_action = await get_ai_orchestrator().arun_coach(
             user_id=request.user_id,
-            current_time=datetime.now(),
+            current_time=now,
             ignored_count=request.ignored_count,
             do_not_disturb=request.do_not_disturb
         )
         
         # If coach suggests schedule changes, implement them
         if coach_action.schedule_changes:
-            schedule_result = get_schedule_orchestrator().process_coach_action(
+            schedule_result = await run_in_threadpool(
+                get_schedule_orchestrator().process_coach_action,
                 coach_action=coach_action,
                 user_id=request.user_id,
-                current_time=datetime.now()
+                current_time=now
             )
-            return {
-                "coach_action": coach_action.model_dump(),
-                "schedule_update": schedule_result
-            }
+            return CoachDecisionResponse(coach_action=coach_action, schedule_update=schedule_result)
         
-        return {
-            "coach_action": coach_action.model_dump(),
-            "schedule_update": None
-        }
+        return CoachDecisionResponse(coach_action=coach_action)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Coach decision failed: {str(e)}")
 
@@ -393,7 +497,11 @@ async def get_coach_history(user_id: str, limit: int = 20):
 
 # ==================== Signal Processing Endpoints ====================
 
-@app.get("/api/ai/signals/current/{user_id}")
+@app.get(
+    "/api/ai/signals/current/{user_id}",
+    response_model=SignalSnapshotResponse,
+    response_model_exclude_none=True,
+)
 async def get_current_signals(user_id: str):
     """
     Get the current signal snapshot (focus and fatigue) for a user.
@@ -404,49 +512,63 @@ async def get_current_signals(user_id: str):
     Returns:
         Latest signal snapshot with focus and fatigue data
     """
+    cached = _signals_cache.get(user_id)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+
     try:
         signal_service = get_signal_service()
-        if signal_service is None:
-            raise HTTPException(status_code=503, detail="Signal processing service is disabled")
         
-        snapshot = signal_service.get_latest_snapshot(user_id)
+        snapshot = await run_in_threadpool(signal_service.get_latest_snapshot, user_id)
         if snapshot is None:
             # Generate a new snapshot if none exists
-            snapshot = signal_service.get_current_signal_snapshot(user_id)
+            snapshot = await run_in_threadpool(signal_service.get_current_signal_snapshot, user_id)
         
-        return {
-            "user_id": user_id,
-            "timestamp": snapshot.timestamp,
-            "focus": {
-                "state": snapshot.focus_state,
-                "score": snapshot.focus_score,
-                "confidence": snapshot.focus_confidence
-            },
-            "fatigue": {
-                "state": snapshot.fatigue_state,
-                "score": snapshot.fatigue_score,
-                "confidence": snapshot.fatigue_confidence
-            }
-        }
+        response = SignalSnapshotResponse(
+            user_id=user_id,
+            timestamp=snapshot.timestamp,
+            focus=SignalReading(
+                state=snapshot.focus_state,
+                score=snapshot.focus_score,
+                confidence=snapshot.focus_confidence
+            ),
+            fatigue=SignalReading(
+                state=snapshot.fatigue_state,
+                score=snapshot.fatigue_score,
+                confidence=snapshot.fatigue_confidence
+            )
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch signals: {str(e)}")
 
+    _signals_cache.pop(user_id, None)
+    _signals_cache[user_id] = (time.monotonic() + SIGNALS_CACHE_SECONDS, response)
+    if len(_signals_cache) > _SIGNALS_CACHE_SIZE:
+        del _signals_cache[next(iter(_signals_cache))]
+    return response
 
-@app.get("/api/ai/signals/history/{user_id}")
+
+@app.get(
+    "/api/ai/signals/history/{user_id}",
+    response_model=SignalHistoryResponse,
+    response_model_exclude_none=True,
+)
 async def get_signal_history(user_id: str, limit: int = 50):
     """Get signal history for a user."""
     try:
-        snapshots = get_signal_service().repository.get_signal_history(user_id, limit)
-        return {
-            "signals": [
-                {
-                    "timestamp": s.timestamp,
-                    "focus": {"state": s.focus_state, "score": s.focus_score},
-                    "fatigue": {"state": s.fatigue_state, "score": s.fatigue_score}
-                }
-                for s in snapshots
+        readings = await run_in_threadpool(
+            get_signal_service().repository.get_signal_history_summary, user_id, limit
+        )
+        return SignalHistoryResponse(
+            signals=[
+                SignalHistoryEntry(
+                    timestamp=s["timestamp"],
+                    focus=SignalReading(state=s["focus_state"], score=s["focus_score"]),
+                    fatigue=SignalReading(state=s["fatigue_state"], score=s["fatigue_score"])
+                )
+                for s in readings
             ]
-        }
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch history: {str(e)}")
 
@@ -459,11 +581,13 @@ async def process_signals(request: SignalProcessingRequest):
     This endpoint would typically be called by a frontend during an active study session.
     """
     try:
-        snapshot = get_signal_service().get_current_signal_snapshot(
+        snapshot = await run_in_threadpool(
+            get_signal_service().get_current_signal_snapshot,
             user_id=request.user_id,
             video_features=None,  # Frontend should send video data
             video_frame=None
         )
+        _signals_cache.pop(request.user_id, None)
         
         return {
             "status": "success",
@@ -504,7 +628,7 @@ async def analyze_frame(
         
         # Combine results
         analysis = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "user_id": user_id,
             "focus": {
                 "score": focus_result.get("focus_score", 0),
@@ -519,8 +643,9 @@ async def analyze_frame(
             }
         }
         
-        # Save to MongoDB signals collection
-        signals_collection.insert_one(analysis)
+        # Save to MongoDB signals collection (pymongo blocks, keep it off the loop)
+        await run_in_threadpool(signals_collection.insert_one, analysis)
+        _signals_cache.pop(user_id, None)
         
         return analysis
         
@@ -529,6 +654,15 @@ async def analyze_frame(
         raise HTTPException(status_code=500, detail=f"Frame analysis failed: {str(e)}")
 
 
+def _find_latest_signals(user_id: str, limit: int) -> list:
+    """Blocking pymongo read, run in the threadpool by get_latest_signals."""
+    return list(
+        signals_collection.find({"user_id": user_id})
+        .sort("timestamp", -1)
+        .limit(limit)
+    )
+
+
 @app.get("/api/ai/signals/latest/{user_id}")
 async def get_latest_signals(user_id: str, limit: int = 10):
     """
@@ -542,11 +676,7 @@ async def get_latest_signals(user_id: str, limit: int = 10):
         List of recent signal analyses
     """
     try:
-        signals = list(
-            signals_collection.find({"user_id": user_id})
-            .sort("timestamp", -1)
-            .limit(limit)
-        )
+        signals = await run_in_threadpool(_find_latest_signals, user_id, limit)
         
         # Convert ObjectId to string
         for signal in signals:
@@ -576,4 +706,5 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Keep polling clients' connections open between requests
+    uvicorn.run(app, host="0.0.0.0", port=8000, timeout_keep_alive=30)
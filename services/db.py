@@ -0,0 +1,28 @@
+"""Process-wide MongoDB client shared by every repository and service.
+
+pymongo clients are thread-safe and pool their own connections, so one
+client per process is enough; each extra client adds its own pool and
+topology monitor threads.
+"""
+
+import os
+import threading
+
+from pymongo import MongoClient
+
+MONGO_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+
+_mongo_client = None
+_mongo_client_lock = threading.Lock()
+
+
+def get_mongo_client() -> MongoClient:
+    """Return the shared MongoClient, creating it on first use."""
+    global _mongo_client
+    if _mongo_client is None:
+        # Services may be built concurrently (e.g. startup warm-up threads)
+        with _mongo_client_lock:
+            if _mongo_client is None:
+                _mongo_client = MongoClient(MONGO_URI, maxPoolSize=MONGO_MAX_POOL_SIZE)
+    return _mongo_client
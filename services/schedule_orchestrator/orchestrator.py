@@ -6,7 +6,7 @@ implementing autonomous schedule adjustments based on ML signals and coaching.
 
 from typing import Optional
 from datetime import datetime, timedelta
-from pymongo import MongoClient
+from services.db import get_mongo_client
 import os
 
 from agents.coach.models.schemas import CoachAction, ScheduleChange
@@ -25,14 +25,22 @@ class ScheduleOrchestrator:
     
     def __init__(self):
         """Initialize the schedule orchestrator with MongoDB connection."""
-        mongo_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
         db_name = os.getenv("MONGO_DB_NAME", "study_partner")
         
-        self.client = MongoClient(mongo_uri)
+        self.client = get_mongo_client()
         self.db = self.client[db_name]
         self.task_scheduling_collection = self.db["task_scheduling"]
         self.study_plan_collection = self.db["studyplans"]  # Match Mongoose pluralization
         self.schedule_history_collection = self.db["schedule_history"]
+
+        # ScheduleChange.action -> handler, resolved with one dict lookup
+        self._handlers = {
+            "add_break": self._add_break,
+            "extend_task": self._extend_task,
+            "reschedule_task": self._reschedule_task,
+            "cancel_task": self._cancel_task,
+            "suspend_session": self._suspend_session,
+        }
     
     def process_coach_action(
         self, 
@@ -64,21 +72,13 @@ class ScheduleOrchestrator:
         schedule_change = coach_action.schedule_changes
         
         # Route to appropriate handler based on action type
-        if schedule_change.action == "add_break":
-            return self._add_break(user_id, schedule_change, current_time)
-        elif schedule_change.action == "extend_task":
-            return self._extend_task(user_id, schedule_change, current_time)
-        elif schedule_change.action == "reschedule_task":
-            return self._reschedule_task(user_id, schedule_change, current_time)
-        elif schedule_change.action == "cancel_task":
-            return self._cancel_task(user_id, schedule_change, current_time)
-        elif schedule_change.action == "suspend_session":
-            return self._suspend_session(user_id, schedule_change, current_time)
-        else:
+        handler = self._handlers.get(schedule_change.action)
+        if handler is None:
             return {
                 "status": "error",
                 "message": f"Unknown schedule action: {schedule_change.action}"
             }
+        return handler(user_id, schedule_change, current_time)
     
     def _add_break(
         self, 
@@ -3,11 +3,12 @@
 This module handles all database operations for user signals.
 """
 
-from pymongo import MongoClient, DESCENDING
+from pymongo import DESCENDING
 from typing import Optional
 from datetime import datetime
 import os
 
+from services.db import get_mongo_client
 from services.signal_processing_service.signal_snapshot import SignalSnapshot
 
 
@@ -16,10 +17,9 @@ class SignalRepository:
     
     def __init__(self):
         """Initialize MongoDB connection."""
-        mongo_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
         db_name = os.getenv("MONGO_DB_NAME", "study_partner")
         
-        self.client = MongoClient(mongo_uri)
+        self.client = get_mongo_client()
         self.db = self.client[db_name]
         self.collection = self.db["signals"]
         
@@ -64,6 +64,23 @@ class SignalRepository:
         
         return SignalSnapshot(**document)
     
+    def get_latest_signal_timestamp(self, user_id: str) -> Optional[datetime]:
+        """
+        Retrieve the timestamp of the most recent signal snapshot for a user.
+
+        Args:
+            user_id: The user's unique identifier
+
+        Returns:
+            The latest snapshot's timestamp, or None if no signals exist
+        """
+        document = self.collection.find_one(
+            {"user_id": user_id},
+            projection={"timestamp": 1, "_id": 0},
+            sort=[("_id", DESCENDING)]
+        )
+        return document["timestamp"] if document else None
+
     def get_signal_history(
         self, 
         user_id: str, 
@@ -91,3 +108,37 @@ class SignalRepository:
             snapshots.append(SignalSnapshot(**doc))
         
         return snapshots
+
+    def get_signal_history_summary(
+        self,
+        user_id: str,
+        limit: int = 10
+    ) -> list[dict]:
+        """
+        Retrieve recent focus and fatigue readings for a user.
+
+        Only the fields the history endpoint shows are fetched, and the
+        documents are returned as-is instead of being parsed into
+        SignalSnapshot objects.
+
+        Args:
+            user_id: The user's unique identifier
+            limit: Maximum number of readings to return
+
+        Returns:
+            List of dicts with timestamp, focus_state, focus_score,
+            fatigue_state and fatigue_score, ordered newest first
+        """
+        return list(self.collection.find(
+            {"user_id": user_id},
+            {
+                "_id": 0,
+                "timestamp": 1,
+                "focus_state": 1,
+                "focus_score": 1,
+                "fatigue_state": 1,
+                "fatigue_score": 1,
+            },
+            sort=[("timestamp", DESCENDING)],
+            limit=limit
+        ))
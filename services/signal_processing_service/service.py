@@ -145,6 +145,18 @@ class SignalProcessingService:
         """
         return self.repository.get_latest_signal_snapshot(user_id)
 
+    def get_latest_snapshot_time(self, user_id: str) -> Optional[datetime]:
+        """
+        Retrieve the timestamp of the most recent signal snapshot for a user.
+
+        Args:
+            user_id: The user's unique identifier
+
+        Returns:
+            The latest snapshot's timestamp, or None if none exists
+        """
+        return self.repository.get_latest_signal_timestamp(user_id)
+
     def is_ready(self) -> bool:
         """
         Check if the service is ready (all models loaded).